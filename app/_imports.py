@@ -56,7 +56,11 @@ try:
         COMPOUND_COLOR_MAP,
         COMPOUND_DISPLAY_MAP,
     )
-    from f1m.modeling import adjust_lap_time_for_conditions, fit_degradation_model
+    from f1m.modeling import (
+        adjust_lap_time_for_conditions,
+        fit_degradation_model,
+        fit_practice_models,
+    )
     from f1m.planner import (
         enumerate_plans,
         live_pit_recommendation,
@@ -92,7 +96,11 @@ except ImportError:
         COMPOUND_COLOR_MAP,
         COMPOUND_DISPLAY_MAP,
     )
-    from f1m.modeling import adjust_lap_time_for_conditions, fit_degradation_model
+    from f1m.modeling import (
+        adjust_lap_time_for_conditions,
+        fit_degradation_model,
+        fit_practice_models,
+    )
     from f1m.planner import (
         enumerate_plans,
         live_pit_recommendation,
@@ -131,6 +139,7 @@ __all__ = [
     "collect_practice_data",
     "adjust_lap_time_for_conditions",
     "fit_degradation_model",
+    "fit_practice_models",
     "enumerate_plans",
     "live_pit_recommendation",
     "plan_aware_recommendation",
@@ -67,15 +67,17 @@ def calculate_consistency_metrics(
         consistency = lap_summary.groupby("compound")["lap_time_s"].agg(
             ["std", "mean", "count"]
         )
-        for compound, row in consistency.iterrows():
+        # itertuples(name=None) yields plain tuples instead of boxing each row
+        # into a Series like iterrows() does.
+        for compound, std, mean, count in consistency.itertuples(name=None):
             compound_str = str(compound)
-            if row["count"] >= 3:
-                cv = (row["std"] / row["mean"]) * 100
+            if count >= 3:
+                cv = (std / mean) * 100
                 metrics[compound_str] = {
-                    "std": row["std"],
-                    "mean": row["mean"],
+                    "std": std,
+                    "mean": mean,
                     "cv_percent": cv,
-                    "samples": row["count"],
+                    "samples": count,
                 }
 
     return metrics
@@ -24,6 +24,7 @@ from _data import (
 from _imports import (
     COL_LAP,
     display_compound,
+    fit_practice_models,
     plan_aware_recommendation,
 )
 
@@ -167,8 +168,11 @@ def render_strategy_tab(
     # Con datos de carrera activos siempre reajustamos para capturar ritmo real
     if pre_models and not has_race_data:
         models = pre_models
-    else:
+    elif has_race_data:
         models = fit_degradation_models(combined_data)
+    else:
+        # Solo prácticas: ajuste memoizado por mtimes de las fuentes
+        models = fit_practice_models(data_root, track, driver)
 
     if not models:
         st.warning("Datos insuficientes para generar modelos de degradación.")
@@ -74,7 +74,7 @@ def per_lap_last_samples(df: pd.DataFrame) -> pd.DataFrame:
     # Calcular lap_time_s por diferencia de timestamp con vuelta anterior dentro de la misma sesión/piloto
     last = last.sort_values(group_cols)
     id_cols = [c for c in SESSION_ID_COLS if c in last.columns]
-    last["prev_timestamp"] = last.groupby(id_cols)["timestamp"].shift(1)
+    last["prev_timestamp"] = last.groupby(id_cols, sort=False)["timestamp"].shift(1)
     last["lap_time_s"] = (last["timestamp"] - last["prev_timestamp"]).dt.total_seconds()
     # Filtrar vueltas inválidas (lap==0 o lap_time_s <=0)
     last = last[last["currentLap"] > 0]
@@ -96,15 +96,17 @@ def compute_features(laps: pd.DataFrame) -> pd.DataFrame:
     if _wear_cols:
         laps["avg_wear"] = laps[_wear_cols].mean(axis=1)
     # Pace index relativo al mejor de la sesión (por track+sessionType)
-    grp = laps.groupby(["trackName", "sessionType"], dropna=False)["lap_time_s"]
+    grp = laps.groupby(["trackName", "sessionType"], dropna=False, sort=False)[
+        "lap_time_s"
+    ]
     # Best lap per session (typed for static analysis)
     best_per_session: pd.Series = grp.transform("min")
     laps["pace_index"] = laps["lap_time_s"] / best_per_session
     # Degradación simple (lap time delta vs rolling median 5 vueltas) por compuesto dentro de sesión
     if "compound" in laps.columns:
-        laps["rolling_med_5"] = laps.groupby(["trackName", "sessionType", "compound"])[
-            "lap_time_s"
-        ].transform(lambda s: s.rolling(5, min_periods=2).median())
+        laps["rolling_med_5"] = laps.groupby(
+            ["trackName", "sessionType", "compound"], sort=False
+        )["lap_time_s"].transform(lambda s: s.rolling(5, min_periods=2).median())
         laps["pace_delta_rolling"] = laps["lap_time_s"] - laps["rolling_med_5"]
     # Fuel effect approximate slope per session (regresión lineal simple si hay fuel)
     if "fuel" in laps.columns and laps["fuel"].notna().sum() > 10:
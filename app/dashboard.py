@@ -6,6 +6,7 @@ los módulos f1m, por lo que este archivo no necesita manipular sys.path directa
 
 from __future__ import annotations
 
+from dataclasses import asdict
 from datetime import datetime
 from pathlib import Path
 from typing import Iterable, Optional
@@ -159,7 +160,7 @@ else:
 
 st.subheader("Stints")
 if stints:
-    stint_df = pd.DataFrame([s.__dict__ for s in stints])
+    stint_df = pd.DataFrame([asdict(s) for s in stints])
     st.dataframe(stint_df, width='stretch')
 else:
     st.info("No se detectaron stints")
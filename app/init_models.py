@@ -9,7 +9,7 @@ from typing import Dict, List, Tuple, Union
 import pandas as pd
 
 from f1m.common import collect_practice_data
-from f1m.modeling import fit_degradation_model
+from f1m.modeling import fit_degradation_model, fit_practice_models
 from f1m.telemetry import (
     DIR_EXPORTED_DATA,
     DIR_LOGS_IN,
@@ -66,14 +66,21 @@ def fallback_race_sample(
     return pd.DataFrame()
 
 
-def prepare_driver_data(data_root: Path, track: str, driver: str) -> pd.DataFrame:
+def prepare_driver_data(
+    data_root: Path, track: str, driver: str
+) -> Tuple[pd.DataFrame, bool]:
+    """Datos de práctica del piloto, o una muestra de carrera como fallback.
+
+    Devuelve ``(datos, es_practica)`` para que el ajuste de prácticas pase por
+    ``fit_practice_models`` (memoizado por mtimes de las fuentes).
+    """
     base = collect_practice_data(data_root, track, driver)
     if base.empty:
         # usar fallback
         track_dir = data_root / track
         fallback = fallback_race_sample(track_dir, track, driver)
-        return fallback
-    return base
+        return fallback, False
+    return base, True
 
 
 def save_models(
@@ -94,11 +101,14 @@ def save_models(
 def build_and_save(
     data_root: Path, track: str, driver: str, out_dir: Path
 ) -> Path | None:
-    data = prepare_driver_data(data_root, track, driver)
+    data, is_practice = prepare_driver_data(data_root, track, driver)
     if data.empty:
         print(f"[WARN] Sin datos para {driver} en {track}")
         return None
-    models = fit_degradation_model(data)
+    if is_practice:
+        models = fit_practice_models(data_root, track, driver)
+    else:
+        models = fit_degradation_model(data)
     if not models:
         print(f"[WARN] Modelos no generados para {driver} (datos insuficientes)")
         return None
@@ -1,38 +1,98 @@
 # f1m package: utilidades de telemetría, modelado y planificación
 
-from .common import (
-    PRACTICE_SESSION_NAMES,
-    canonical_compound,
-    collect_practice_data,
-    compound_color,
-    display_compound,
-)
-from .imports import (
-    Dict,
-    List,
-    Optional,
-    Path,
-    Tuple,
-    Union,
-    np,
-    optimize_dataframe_memory,
-    pd,
-)
-from .modeling import (
-    fit_degradation_model,
-    max_stint_length,
-    stint_time,
-)
-from .planner import enumerate_plans, live_pit_recommendation, plan_aware_recommendation
-from .telemetry import (
-    Stint,
-    build_lap_summary,
-    build_stints,
-    detect_pit_events,
-    fia_compliance_check,
-    load_multi_session_csvs,
-    load_session_csv,
-)
-
-# Hace que 'f1m' sea un paquete estándar para importaciones fiables.
-__all__: list[str] = []
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+# Public name -> submodule. Submodules load on first attribute access (PEP 562),
+# so ``from f1m.common import ...`` no longer pulls in modeling and planner.
+_EXPORTS = {
+    "PRACTICE_SESSION_NAMES": "common",
+    "canonical_compound": "common",
+    "collect_practice_data": "common",
+    "compound_color": "common",
+    "display_compound": "common",
+    "practice_sources_key": "common",
+    "Dict": "imports",
+    "List": "imports",
+    "Optional": "imports",
+    "Path": "imports",
+    "Tuple": "imports",
+    "Union": "imports",
+    "np": "imports",
+    "optimize_dataframe_memory": "imports",
+    "pd": "imports",
+    "fit_degradation_model": "modeling",
+    "fit_practice_models": "modeling",
+    "max_stint_length": "modeling",
+    "max_stint_lengths": "modeling",
+    "stint_time": "modeling",
+    "enumerate_plans": "planner",
+    "live_pit_recommendation": "planner",
+    "plan_aware_recommendation": "planner",
+    "Stint": "telemetry",
+    "build_lap_summary": "telemetry",
+    "build_stints": "telemetry",
+    "detect_pit_events": "telemetry",
+    "fia_compliance_check": "telemetry",
+    "load_multi_session_csvs": "telemetry",
+    "load_session_csv": "telemetry",
+}
+
+__all__ = list(_EXPORTS)
+
+if TYPE_CHECKING:
+    from .common import (
+        PRACTICE_SESSION_NAMES,
+        canonical_compound,
+        collect_practice_data,
+        compound_color,
+        display_compound,
+        practice_sources_key,
+    )
+    from .imports import (
+        Dict,
+        List,
+        Optional,
+        Path,
+        Tuple,
+        Union,
+        np,
+        optimize_dataframe_memory,
+        pd,
+    )
+    from .modeling import (
+        fit_degradation_model,
+        fit_practice_models,
+        max_stint_length,
+        max_stint_lengths,
+        stint_time,
+    )
+    from .planner import (
+        enumerate_plans,
+        live_pit_recommendation,
+        plan_aware_recommendation,
+    )
+    from .telemetry import (
+        Stint,
+        build_lap_summary,
+        build_stints,
+        detect_pit_events,
+        fia_compliance_check,
+        load_multi_session_csvs,
+        load_session_csv,
+    )
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{module_name}", __name__), name)
+    globals()[name] = value  # later lookups skip __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
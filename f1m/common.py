@@ -1,10 +1,29 @@
 from __future__ import annotations
 
+import hashlib
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any
+
 from .constants import COMPOUND_CANONICAL_MAP, COMPOUND_COLOR_MAP, COMPOUND_DISPLAY_MAP
 from .imports import Path, pd
 from .telemetry import (
+    COL_AVG_WEAR,
+    COL_COMPOUND,
+    COL_FUEL,
+    COL_LAP,
     COL_LAP_TIME,
+    COL_PACE_MODE,
+    COL_RAIN,
+    COL_RUBBER,
+    COL_SAFETY_CAR,
+    COL_SESSION,
+    COL_TIRE_AGE,
+    DIR_CACHE,
     DIR_CURATED,
+    LIVE_FILE_SECONDS,
     build_lap_summary,
     load_session_csv,
     optimize_dataframe_memory,
@@ -20,6 +39,33 @@ PRACTICE_SESSION_NAMES = {
     "FP3",
 }
 
+# Curated laps.parquet columns read for practice data: the lap-summary columns
+# the CSV fallback produces plus fuelDelta. Partition keys (track/driver names)
+# and curation-only columns are pruned at read time.
+PRACTICE_PARQUET_COLUMNS = (
+    COL_LAP,
+    COL_LAP_TIME,
+    COL_COMPOUND,
+    COL_TIRE_AGE,
+    "sessionType",
+    COL_SESSION,
+    "trackTemp",
+    "airTemp",
+    "flTemp",
+    "frTemp",
+    "rlTemp",
+    "rrTemp",
+    COL_FUEL,
+    "fuelDelta",
+    "pit_stop",
+    "tire_change_pit",
+    COL_SAFETY_CAR,
+    COL_RAIN,
+    COL_PACE_MODE,
+    COL_RUBBER,
+    COL_AVG_WEAR,
+)
+
 
 def display_compound(raw: str) -> str:
     """Return enriched display label for a compound name.
@@ -51,11 +97,366 @@ def canonical_compound(raw: str) -> str:
     return COMPOUND_CANONICAL_MAP.get(str(raw), str(raw))
 
 
-def collect_practice_data(data_root: Path, track: str, driver: str) -> pd.DataFrame:
+def practice_sources_key(
+    data_root: Path, track: str, driver: str
+) -> tuple[tuple[str, int], ...]:
+    """Return ``(path, mtime_ns)`` for every file that feeds ``driver``'s practice data.
+
+    Scoped like ``collect_practice_data``: the curated ``laps.parquet`` of the
+    driver's practice partitions plus the CSVs in the driver's folders of the
+    raw practice sessions. Race exports and other drivers' files leave the
+    key unchanged.
+    """
+    files: list[Path] = []
+    curated_dir = data_root.parent.parent / DIR_CURATED / f"track={track}"
+    if curated_dir.is_dir():
+        files.extend(
+            driver_dir / "laps.parquet"
+            for driver_dir in _curated_driver_dirs(
+                str(curated_dir),
+                driver.replace(" ", "_"),
+                _practice_session_mtimes(curated_dir, prefix="session="),
+            )
+        )
+    track_dir = data_root / track
+    if track_dir.is_dir():
+        for _, driver_dir in _practice_driver_dirs(
+            str(track_dir), driver, _practice_session_mtimes(track_dir)
+        ):
+            try:
+                files.extend(_scan_csv_files(driver_dir))
+            except OSError:
+                continue
+    entries: list[tuple[str, int]] = []
+    for path in files:
+        try:
+            entries.append((str(path), path.stat().st_mtime_ns))
+        except OSError:
+            continue
+    return tuple(sorted(entries))
+
+
+def _is_practice_session(name: str) -> bool:
+    return name in PRACTICE_SESSION_NAMES or name.startswith("Practice")
+
+
+def _practice_session_mtimes(
+    track_dir: Path, prefix: str = ""
+) -> tuple[tuple[str, int], ...]:
+    """Return sorted ``(dir_name, mtime_ns)`` for the practice sessions of a track.
+
+    Single ``os.scandir`` pass: names are checked first and ``is_dir()``
+    answers from the directory listing, so only practice sessions cost a
+    stat call. ``prefix`` ("session=" for curated partitions) is stripped
+    before the name check.
+    """
+    with os.scandir(track_dir) as entries:
+        return tuple(
+            sorted(
+                (entry.name, entry.stat().st_mtime_ns)
+                for entry in entries
+                if _is_practice_session(entry.name.replace(prefix, ""))
+                and entry.is_dir()
+            )
+        )
+
+
+def _scan_csv_files(directory: Path) -> list[Path]:
+    """Sorted CSV files directly inside ``directory`` (one ``os.scandir`` pass)."""
+    with os.scandir(directory) as entries:
+        return sorted(
+            Path(entry.path)
+            for entry in entries
+            if entry.name.endswith(".csv")
+            and not entry.name.startswith(".")
+            and entry.is_file()
+        )
+
+
+@lru_cache(maxsize=32)
+def _curated_partition_index(
+    track_dir: str,
+    session_mtimes: tuple[tuple[str, int], ...],
+) -> tuple[tuple[str, Path], ...]:
+    """Return ``(dir_name, path)`` for every curated ``driver=...`` partition.
+
+    One walk per track, shared by every driver queried on it. Keyed on the
+    mtimes of the practice ``session=...`` directories, which change
+    whenever a driver partition is added or removed.
+    """
+    index: list[tuple[str, Path]] = []
+    for session_name, _ in session_mtimes:
+        with os.scandir(Path(track_dir) / session_name) as entries:
+            index.extend(
+                (entry.name, Path(entry.path)) for entry in entries if entry.is_dir()
+            )
+    return tuple(index)
+
+
+def _curated_driver_dirs(
+    track_dir: str,
+    driver_key: str,
+    session_mtimes: tuple[tuple[str, int], ...],
+) -> tuple[Path, ...]:
+    """Return the curated ``driver=...`` partitions matching ``driver_key``."""
+    return tuple(
+        path
+        for name, path in _curated_partition_index(track_dir, session_mtimes)
+        if driver_key in name
+    )
+
+
+@lru_cache(maxsize=1)
+def _pyarrow_parquet() -> Any:
+    """``pyarrow.parquet`` or None; imported on the first curated read only.
+
+    Keeps ``import f1m.common`` (and the CSV-only paths) free of the pyarrow
+    import cost.
+    """
+    try:
+        import pyarrow.parquet as pq
+    except ImportError:
+        return None
+    return pq
+
+
+@lru_cache(maxsize=256)
+def _read_laps_parquet(path: str, mtime_ns: int) -> pd.DataFrame:
+    """Read one curated ``laps.parquet``; cached until the file changes.
+
+    The ``lap_time_s > 0`` predicate is pushed down to the Parquet reader so
+    dead laps are skipped at read time; ``_drop_invalid_laps`` still runs
+    for engines that only filter whole row groups. With pyarrow only the
+    ``PRACTICE_PARQUET_COLUMNS`` present in the file footer are read.
+    """
+    columns = None
+    pq = _pyarrow_parquet()
+    if pq is not None:
+        available = set(pq.read_schema(path).names)
+        columns = [c for c in PRACTICE_PARQUET_COLUMNS if c in available]
+    lap_sum = pd.read_parquet(path, columns=columns, filters=[(COL_LAP_TIME, ">", 0)])
+    # Rename sessionType to session for consistency
+    if "sessionType" in lap_sum.columns:
+        lap_sum = lap_sum.rename(columns={"sessionType": "session"})
+    return _drop_invalid_laps(lap_sum)
+
+
+_DRIVER_DIRS_MAX = 64
+# (track_dir, driver) -> (session mtimes, mtimes of every directory walked, pairs)
+_DRIVER_DIRS: dict[
+    tuple[str, str],
+    tuple[
+        tuple[tuple[str, int], ...],
+        tuple[tuple[str, int], ...],
+        tuple[tuple[str, Path], ...],
+    ],
+] = {}
+
+
+def _dirs_unchanged(walked: tuple[tuple[str, int], ...]) -> bool:
+    try:
+        return all(os.stat(path).st_mtime_ns == mtime for path, mtime in walked)
+    except OSError:
+        return False
+
+
+def _practice_driver_dirs(
+    track_dir: str,
+    driver: str,
+    session_mtimes: tuple[tuple[str, int], ...],
+) -> tuple[tuple[str, Path], ...]:
+    """Return ``(session_name, driver_dir)`` pairs for the raw CSV fallback.
+
+    Driver folders are matched at any depth below a session, like ``rglob``.
+    The result is kept with the mtime of every directory the walk listed, so
+    a later call only re-stats those directories and walks again when a
+    folder was added, removed or renamed anywhere below a session.
+    """
+    key = (track_dir, driver)
+    cached = _DRIVER_DIRS.get(key)
+    if (
+        cached is not None
+        and cached[0] == session_mtimes
+        and _dirs_unchanged(cached[1])
+    ):
+        return cached[2]
+    walked: list[tuple[str, int]] = []
+    pairs: list[tuple[str, Path]] = []
+    for session_name, _ in session_mtimes:
+        stack = [os.path.join(track_dir, session_name)]
+        while stack:
+            current = stack.pop()
+            try:
+                walked.append((current, os.stat(current).st_mtime_ns))
+                with os.scandir(current) as entries:
+                    subdirs = [e for e in entries if e.is_dir()]
+            except OSError:
+                continue
+            for entry in subdirs:
+                if entry.name == driver:
+                    pairs.append((session_name, Path(entry.path)))
+                if not entry.is_symlink():  # like rglob, do not follow links
+                    stack.append(entry.path)
+    result = tuple(sorted(pairs))
+    if key not in _DRIVER_DIRS and len(_DRIVER_DIRS) >= _DRIVER_DIRS_MAX:
+        _DRIVER_DIRS.pop(next(iter(_DRIVER_DIRS)))
+    _DRIVER_DIRS[key] = (session_mtimes, tuple(walked), result)
+    return result
+
+
+# Bump whenever the practice aggregation or its dtypes change so sidecars
+# written by older code are rebuilt instead of served.
+_CACHE_VERSION = 2
+
+
+def _practice_cache_prefix(track: str, driver: str) -> str:
+    """File-name prefix shared by every sidecar of one track/driver pair."""
+    owner = hashlib.blake2b(f"{track}|{driver}".encode(), digest_size=6).hexdigest()
+    return f"practice_{owner}_"
+
+
+def _practice_cache_path(
+    data_root: Path,
+    track: str,
+    driver: str,
+    sources: tuple[tuple[str, int], ...],
+) -> Path:
+    """Parquet sidecar for ``collect_practice_data`` keyed on its inputs.
+
+    The key hashes every ``(path, mtime_ns)`` pair of the driver's ``sources``
+    (``practice_sources_key``) plus ``_CACHE_VERSION``, so adding, rewriting,
+    replacing or removing one of the driver's practice exports, or upgrading
+    the aggregation code, yields a new file name.
+    """
+    digest = hashlib.blake2b(digest_size=8)
+    digest.update(f"{_CACHE_VERSION}|{track}|{driver}".encode())
+    for path, mtime in sources:
+        digest.update(f"|{path}|{mtime}".encode())
+    name = f"{_practice_cache_prefix(track, driver)}{digest.hexdigest()}.parquet"
+    # Next to curated/ rather than inside data_root, where it would be listed as a track
+    return data_root.parent.parent / DIR_CACHE / name
+
+
+def _prune_cache_files(cache_path: Path, prefix: str) -> None:
+    """Delete the other ``<prefix>*.parquet`` files next to ``cache_path``.
+
+    Keeps one sidecar per owner: older keys can never be hit again.
+    """
+    for stale in cache_path.parent.glob(f"{prefix}*.parquet"):
+        if stale != cache_path:
+            try:
+                stale.unlink()
+            except OSError:
+                continue
+
+
+def collect_practice_data(
+    data_root: Path,
+    track: str,
+    driver: str,
+    sources: tuple[tuple[str, int], ...] | None = None,
+) -> pd.DataFrame:
     """Aggregate lap summaries from all practice sessions for given track & driver.
 
     Optimized to read from curated Parquet files instead of processing CSVs.
+    The result is memoized to a Parquet sidecar under ``.cache/`` so
+    repeated calls read one file instead of re-parsing every session. While one
+    of the driver's practice sources was modified within ``LIVE_FILE_SECONDS``
+    (a session still being logged) the result is rebuilt without writing a
+    sidecar. ``sources`` is ``practice_sources_key(data_root, track, driver)``
+    when the caller already computed it.
     """
+    if sources is None:
+        sources = practice_sources_key(data_root, track, driver)
+    cache_path = _practice_cache_path(data_root, track, driver, sources)
+    newest = max((mtime for _, mtime in sources), default=0)
+    live = time.time() - newest / 1e9 < LIVE_FILE_SECONDS
+    if cache_path.exists():
+        try:
+            return pd.read_parquet(cache_path)
+        except (ImportError, OSError, TypeError, ValueError):
+            # No Parquet engine or unreadable sidecar: rebuild below
+            pass
+
+    out = _build_practice_data(data_root, track, driver)
+    if not out.empty and not live:
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_suffix(".tmp")
+            out.to_parquet(tmp_path, compression="zstd")
+            tmp_path.replace(cache_path)
+            _prune_cache_files(cache_path, _practice_cache_prefix(track, driver))
+        except (ImportError, OSError, TypeError, ValueError):
+            # Caching is best-effort (read-only data dir, no Parquet engine)
+            pass
+    return out
+
+
+def _drop_invalid_laps(lap_sum: pd.DataFrame) -> pd.DataFrame:
+    """Clean lap_time_s (drop None / zeros) before the frame is concatenated."""
+    if COL_LAP_TIME not in lap_sum.columns:
+        return lap_sum.iloc[0:0]
+    lap_time = lap_sum[COL_LAP_TIME]
+    return lap_sum[lap_time.notna() & (lap_time > 0)]
+
+
+def _csv_lap_summary(csv: Path, cache_dir: Path) -> pd.DataFrame:
+    """``build_lap_summary`` of one CSV, memoized as Parquet under ``cache_dir``.
+
+    The side file is keyed on the CSV path, mtime, size and ``_CACHE_VERSION``,
+    so a rewritten export or a change to the lap-summary code is parsed again
+    while untouched ones are read back typed and columnar. Writing a new copy
+    deletes the older ones of the same CSV. Exports modified within
+    ``LIVE_FILE_SECONDS`` are summarized without a disk copy. Caching is
+    best-effort, like the practice sidecar.
+    """
+    stat = csv.stat()
+    if time.time() - stat.st_mtime_ns / 1e9 < LIVE_FILE_SECONDS:
+        # Still being written by the logger: a copy would be stale on arrival
+        return build_lap_summary(load_session_csv(csv))
+    owner = hashlib.blake2b(str(csv.resolve()).encode(), digest_size=6).hexdigest()
+    key = hashlib.blake2b(
+        f"{_CACHE_VERSION}|{stat.st_mtime_ns}|{stat.st_size}".encode(), digest_size=8
+    ).hexdigest()
+    prefix = f"laps_{owner}_"
+    cache_path = cache_dir / f"{prefix}{key}.parquet"
+    if cache_path.exists():
+        try:
+            return pd.read_parquet(cache_path)
+        except (ImportError, OSError, TypeError, ValueError):
+            pass
+    lap_sum = build_lap_summary(load_session_csv(csv))
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(".tmp")
+        lap_sum.to_parquet(tmp_path, compression="zstd")
+        tmp_path.replace(cache_path)
+        _prune_cache_files(cache_path, prefix)
+    except (ImportError, OSError, TypeError, ValueError):
+        pass
+    return lap_sum
+
+
+def _load_practice_csv(item: tuple[str, Path, Path]) -> pd.DataFrame | None:
+    """Lap summary of one practice CSV tagged with its session, or None."""
+    session_name, csv, cache_dir = item
+    try:
+        lap_sum = _csv_lap_summary(csv, cache_dir)
+        lap_sum["session"] = session_name
+        return _drop_invalid_laps(lap_sum)
+    except (
+        FileNotFoundError,
+        PermissionError,
+        pd.errors.EmptyDataError,
+        pd.errors.ParserError,
+        KeyError,
+        ValueError,
+    ):
+        # Skip corrupted or inaccessible CSV files
+        return None
+
+
+def _build_practice_data(data_root: Path, track: str, driver: str) -> pd.DataFrame:
     # Try to use curated data first
     project_root = data_root.parent.parent
     curated_root = project_root / DIR_CURATED
@@ -66,81 +467,71 @@ def collect_practice_data(data_root: Path, track: str, driver: str) -> pd.DataFr
     if curated_root.exists():
         track_dir = curated_root / f"track={track}"
         if track_dir.exists():
-            for session_dir in track_dir.iterdir():
-                if not session_dir.is_dir():
+            # Directory format is "driver=14_Fernando_Alonso" (underscores).
+            # Normalise both sides to underscores before matching so
+            # "Fernando Alonso" matches "driver=14_Fernando_Alonso".
+            driver_key = driver.replace(" ", "_")
+            session_mtimes = _practice_session_mtimes(track_dir, prefix="session=")
+            for driver_dir in _curated_driver_dirs(
+                str(track_dir), driver_key, session_mtimes
+            ):
+                parquet_file = driver_dir / "laps.parquet"
+                try:
+                    mtime_ns = parquet_file.stat().st_mtime_ns
+                except OSError:
                     continue
-                session_name = session_dir.name.replace("session=", "")
-                if (
-                    session_name not in PRACTICE_SESSION_NAMES
-                    and not session_name.startswith("Practice")
+                try:
+                    frames.append(
+                        _read_laps_parquet(str(parquet_file), mtime_ns).copy(deep=False)
+                    )
+                except (
+                    FileNotFoundError,
+                    PermissionError,
+                    pd.errors.EmptyDataError,
+                    ValueError,
+                    KeyError,
                 ):
+                    # Skip corrupted or inaccessible Parquet files
                     continue
-                # Find driver directory matching the driver name
-                for driver_dir in session_dir.iterdir():
-                    if not driver_dir.is_dir():
-                        continue
-                    # Directory format is "driver=14_Fernando_Alonso" (underscores).
-                    # Normalise both sides to underscores before matching so
-                    # "Fernando Alonso" matches "driver=14_Fernando_Alonso".
-                    if driver.replace(" ", "_") in driver_dir.name:
-                        parquet_file = driver_dir / "laps.parquet"
-                        if parquet_file.exists():
-                            try:
-                                lap_sum = pd.read_parquet(parquet_file)
-                                # Rename sessionType to session for consistency
-                                if "sessionType" in lap_sum.columns:
-                                    lap_sum = lap_sum.rename(
-                                        columns={"sessionType": "session"}
-                                    )
-                                frames.append(lap_sum)
-                            except (
-                                FileNotFoundError,
-                                PermissionError,
-                                pd.errors.EmptyDataError,
-                                ValueError,
-                                KeyError,
-                            ):
-                                # Skip corrupted or inaccessible Parquet files
-                                continue
 
     # Fallback to processing CSVs if no curated data found
     if not frames:
         track_dir = data_root / track
         if not track_dir.exists():
             return pd.DataFrame()
-        for session_dir in track_dir.iterdir():
-            if not session_dir.is_dir():
-                continue
-            if (
-                session_dir.name not in PRACTICE_SESSION_NAMES
-                and not session_dir.name.startswith("Practice")
-            ):
-                continue
-            # Search within driver subdirs
-            for d in session_dir.rglob(driver):
-                if d.is_dir():
-                    for csv in d.glob("*.csv"):
-                        try:
-                            df = load_session_csv(csv)
-                            lap_sum = build_lap_summary(df)
-                            lap_sum["session"] = session_dir.name
-                            frames.append(lap_sum)
-                        except (
-                            FileNotFoundError,
-                            PermissionError,
-                            pd.errors.EmptyDataError,
-                            pd.errors.ParserError,
-                            KeyError,
-                            ValueError,
-                        ):
-                            # Skip corrupted or inaccessible CSV files
-                            continue
+        session_mtimes = _practice_session_mtimes(track_dir)
+        # Collect every CSV up front (directory walk cached per mtime snapshot),
+        # then read them in one pass and concatenate once below
+        cache_dir = project_root / DIR_CACHE
+        csv_files = [
+            (session_name, csv, cache_dir)
+            for session_name, d in _practice_driver_dirs(
+                str(track_dir), driver, session_mtimes
+            )
+            for csv in _scan_csv_files(d)
+        ]
+        # Files are independent and parsing is mostly I/O and C code, so the
+        # reads overlap on a thread pool (map keeps the file order)
+        if len(csv_files) > 1:
+            workers = min(len(csv_files), os.cpu_count() or 1)
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                loaded = list(pool.map(_load_practice_csv, csv_files))
+        else:
+            loaded = [_load_practice_csv(item) for item in csv_files]
+        frames.extend(f for f in loaded if f is not None)
 
     if frames:
+        # Frames are already cleaned, so the single concat copies only valid laps
         out = pd.concat(frames, ignore_index=True)
-        # Clean lap_time_s (drop None / zeros)
-        out = out[(out[COL_LAP_TIME].notna()) & (out[COL_LAP_TIME] > 0)]
-        # Optimize memory usage
-        out = optimize_dataframe_memory(out)
+        # Optimize memory usage: float32/int downcasts plus categorical
+        # compound/session so grouping works on small integer codes. Both are
+        # forced even when the unique-ratio heuristic would keep them as
+        # strings; categories come from the data (raw specs such as "C3").
+        out = optimize_dataframe_memory(out, obj2cat=True)
+        for col in (COL_COMPOUND, COL_SESSION):
+            if col in out.columns and not isinstance(
+                out[col].dtype, pd.CategoricalDtype
+            ):
+                out[col] = out[col].astype("category")
         return out
     return pd.DataFrame()
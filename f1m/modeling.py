@@ -1,6 +1,9 @@
 from __future__ import annotations
 
-from .common import canonical_compound
+from functools import lru_cache
+from typing import TypeVar
+
+from .common import canonical_compound, collect_practice_data, practice_sources_key
 from .imports import (
     COL_AVG_WEAR,
     COL_PACE_MODE,
@@ -15,6 +18,8 @@ from .imports import (
     SAFETY_CAR_TIME_MULTIPLIER,
     WEAR_CLIFF,
     Dict,
+    List,
+    Optional,
     Path,
     Tuple,
     Union,
@@ -23,6 +28,56 @@ from .imports import (
 )
 
 
+def _solve_ols(A: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """Least-squares coefficients for a small design matrix via normal equations.
+
+    The per-compound fits have 2-4 parameters, so solving ``(A'A) x = A'y``
+    is far cheaper than the SVD behind ``lstsq``. Rank-deficient systems
+    (e.g. a constant fuel column) fall back to ``lstsq``.
+    """
+    try:
+        return np.linalg.solve(A.T @ A, A.T @ y)
+    except np.linalg.LinAlgError:
+        coef, *_ = np.linalg.lstsq(A, y, rcond=None)  # type: ignore[call-overload]
+        return coef
+
+
+def _fit_line(x: np.ndarray, y: np.ndarray) -> Tuple[float, float]:
+    """Closed-form simple linear regression ``y ≈ a + b*x`` (centred sums).
+
+    A constant ``x`` (possible once outliers are dropped) falls back to
+    ``_solve_ols``.
+    """
+    x_mean = float(x.mean())
+    y_mean = float(y.mean())
+    dx = x - x_mean
+    sxx = float(dx @ dx)
+    if sxx == 0.0:
+        a, b = _solve_ols(np.column_stack([np.ones(len(x)), x]), y)
+        return float(a), float(b)
+    b = float(dx @ (y - y_mean)) / sxx
+    return y_mean - b * x_mean, b
+
+
+def _solve_ols_batched(
+    designs: List[np.ndarray], targets: List[np.ndarray]
+) -> List[np.ndarray]:
+    """Solve several same-width OLS problems with one batched ``np.linalg.solve``.
+
+    The normal equations of every problem are stacked into ``(G, k, k)`` and
+    ``(G, k)`` arrays. If any system is singular the batch falls back to
+    ``_solve_ols`` per problem.
+    """
+    if not designs:
+        return []
+    AtA = np.stack([A.T @ A for A in designs])
+    Aty = np.stack([A.T @ y for A, y in zip(designs, targets)])
+    try:
+        return list(np.linalg.solve(AtA, Aty[..., None])[..., 0])
+    except np.linalg.LinAlgError:
+        return [_solve_ols(A, y) for A, y in zip(designs, targets)]
+
+
 def fit_degradation_model(
     practice_laps: pd.DataFrame,
 ) -> Dict[str, Union[Tuple[float, float], Tuple[float, float, float], Tuple[float, float, float, float]]]:
@@ -31,8 +86,16 @@ def fit_degradation_model(
         return models
     # Normalise all raw compound IDs/specs to canonical hardness categories so
     # that variants like "C3" and "C4" are merged into "Soft" for regression.
-    practice_laps = practice_laps.copy()
-    practice_laps["compound"] = practice_laps["compound"].apply(canonical_compound)
+    # Canonicalised per distinct value (categorical input factorizes on its
+    # codes) and mapped back to rows as integer group codes.
+    raw_codes, raw_uniques = pd.factorize(
+        practice_laps["compound"], use_na_sentinel=False
+    )
+    group_codes, group_names = pd.factorize(
+        np.array([canonical_compound(u) for u in raw_uniques], dtype=object),
+        sort=True,
+    )
+    codes = group_codes[raw_codes]
 
     # Rubber detrending: remove global track-grip trend from lap times so that
     # b_age captures pure tire degradation, not the confounded rubber build-up.
@@ -44,43 +107,39 @@ def fit_degradation_model(
         and practice_laps[_rubber_col].notna().sum() >= 5
         and float(practice_laps[_rubber_col].std()) > MIN_RUBBER_STD
     )
+    # The detrended lap times live in their own array so the caller's frame is
+    # never copied or written to.
+    lap_times = practice_laps["lap_time_s"].to_numpy(
+        dtype=np.float64, na_value=np.nan, copy=True
+    )
     if rubber_available:
+        rubber = practice_laps[_rubber_col].to_numpy(dtype=np.float64, na_value=np.nan)
         _session_col = "session" if "session" in practice_laps.columns else None
         if _session_col is not None:
             # Per-session detrending: removes within-session track evolution only.
             # Global detrending across FP1/FP2/FP3 causes multicollinearity because
             # rubber also increases between sessions alongside fuel, temp, and setup changes.
-            for _sess_id, _sess_mask in practice_laps.groupby(_session_col).groups.items():
-                sess_rows = practice_laps.loc[_sess_mask]
-                valid_s = sess_rows[[_rubber_col, "lap_time_s"]].notna().all(axis=1)
-                valid_s = valid_s[valid_s].index
-                if len(valid_s) < 3:
+            for _sess_id, _sess_pos in practice_laps.groupby(
+                _session_col, sort=False, observed=True
+            ).indices.items():
+                r_sess = rubber[_sess_pos]
+                lt_sess = lap_times[_sess_pos]
+                valid_s = ~np.isnan(r_sess) & ~np.isnan(lt_sess)
+                if int(valid_s.sum()) < 3:
                     continue
-                r_s = np.array(sess_rows.loc[valid_s, _rubber_col].values, dtype=np.float64)
+                r_s = r_sess[valid_s]
                 if float(r_s.std()) <= MIN_RUBBER_STD:
                     continue
-                lt_s = sess_rows.loc[valid_s, "lap_time_s"].values.astype(float)
-                A_r = np.column_stack([np.ones_like(r_s), r_s])  # type: ignore[call-overload]
-                coef_r, *_ = np.linalg.lstsq(A_r, lt_s, rcond=None)  # type: ignore[call-overload]
-                e_rubber = float(coef_r[1])
-                rubber_ref = float(sess_rows[_rubber_col].mean())
-                practice_laps.loc[_sess_mask, "lap_time_s"] = (
-                    practice_laps.loc[_sess_mask, "lap_time_s"]
-                    - e_rubber * (practice_laps.loc[_sess_mask, _rubber_col] - rubber_ref)
-                )
+                _, e_rubber = _fit_line(r_s, lt_sess[valid_s])
+                rubber_ref = float(np.nanmean(r_sess))
+                lap_times[_sess_pos] = lt_sess - e_rubber * (r_sess - rubber_ref)
         else:
             # Fallback: global detrending (single-session data — no session column)
-            valid_mask = practice_laps[[_rubber_col, "lap_time_s"]].notna().all(axis=1)
-            if valid_mask.sum() >= 5:
-                r_vals = practice_laps.loc[valid_mask, _rubber_col].values.astype(float)
-                lt_vals = practice_laps.loc[valid_mask, "lap_time_s"].values.astype(float)
-                A_r = np.column_stack([np.ones_like(r_vals), r_vals])  # type: ignore[call-overload]
-                coef_r, *_ = np.linalg.lstsq(A_r, lt_vals, rcond=None)  # type: ignore[call-overload]
-                e_rubber = float(coef_r[1])
-                rubber_ref = float(practice_laps[_rubber_col].mean())
-                practice_laps["lap_time_s"] = (
-                    practice_laps["lap_time_s"] - e_rubber * (practice_laps[_rubber_col] - rubber_ref)
-                )
+            valid_mask = ~np.isnan(rubber) & ~np.isnan(lap_times)
+            if int(valid_mask.sum()) >= 5:
+                _, e_rubber = _fit_line(rubber[valid_mask], lap_times[valid_mask])
+                rubber_ref = float(np.nanmean(rubber))
+                lap_times = lap_times - e_rubber * (rubber - rubber_ref)
     fuel_available = (
         "fuel" in practice_laps.columns
         and practice_laps["fuel"].notna().sum() >= 5
@@ -92,149 +151,246 @@ def fit_degradation_model(
         and practice_laps[_temp_col].notna().sum() >= 5
         and float(practice_laps[_temp_col].std()) > MIN_TEMP_STD
     )
-    for comp_raw, grp in practice_laps.groupby("compound"):
-        comp = str(comp_raw)
-        if grp["tire_age"].nunique() < 2 or len(grp) < 5:
-            continue
+    # Regressor columns in cascade order: every stage's design matrix is the
+    # leading [1, tire_age, ...] slice of the block built below.
+    cols = ["tire_age"]
+    if fuel_available:
+        cols.append("fuel")
+    if temp_available:
+        cols.append(_temp_col)
+    # Sort-based grouping: stable-sort the row positions by compound code and
+    # slice per compound, so the selection below works on NumPy index arrays
+    # instead of per-group DataFrames.
+    order = np.argsort(codes, kind="stable")
+    bounds = np.searchsorted(codes[order], np.arange(len(group_names) + 1))
+    # One row-major block [1, regressors..., lap_time_s]: each compound is
+    # gathered with a single row take and needs no column_stack afterwards.
+    block = np.empty((len(practice_laps), len(cols) + 2))
+    block[:, 0] = 1.0
+    for j, c in enumerate(cols, start=1):
+        block[:, j] = practice_laps[c].to_numpy(dtype=np.float64, na_value=np.nan)
+    block[:, -1] = lap_times
+    ages = block[:, 1]
+    complete = ~np.isnan(block[:, 1:]).any(axis=1)
+    excluded = np.zeros(len(practice_laps), dtype=bool)
+    # Filter out laps with Safety Car, rain or any pit stop (inflated lap times)
+    for flag_col in (COL_SAFETY_CAR, COL_RAIN, "pit_stop"):
+        if flag_col in practice_laps.columns:
+            excluded |= practice_laps[flag_col].fillna(False).to_numpy(dtype=bool)
+    # Pace modes as integer codes (-1 = missing): the dominant mode of each
+    # compound is counted on a code slice instead of a pandas value_counts.
+    pace_codes: Optional[np.ndarray] = None
+    aggressive = np.zeros(len(practice_laps), dtype=bool)
+    if COL_PACE_MODE in practice_laps.columns:
+        pace_codes = pd.factorize(practice_laps[COL_PACE_MODE])[0]
+        aggressive = (
+            practice_laps[COL_PACE_MODE].isin(["Attack", "Aggressive"]).to_numpy()
+        )
+
+    def _n_ages(idx: np.ndarray) -> int:
+        a = ages[idx]
+        return len(np.unique(a[~np.isnan(a)]))
+
+    # Up-front eligibility of every compound (>= 5 laps, >= 2 distinct ages):
+    # one lexsort over (compound, age) instead of a unique() per group.
+    has_age = ~np.isnan(ages)
+    by_comp_age = np.lexsort((ages[has_age], codes[has_age]))
+    codes_s = codes[has_age][by_comp_age]
+    ages_s = ages[has_age][by_comp_age]
+    first_of_pair = np.ones(len(codes_s), dtype=bool)
+    first_of_pair[1:] = (codes_s[1:] != codes_s[:-1]) | (ages_s[1:] != ages_s[:-1])
+    group_n_ages = np.bincount(codes_s[first_of_pair], minlength=len(group_names))
+    eligible = (np.diff(bounds) >= 5) & (group_n_ages >= 2)
 
-        # Filter out laps with Safety Car, rain or any pit stop (inflated lap times)
-        filtered_grp = grp.copy()
-        if COL_SAFETY_CAR in grp.columns:
-            filtered_grp = filtered_grp[~filtered_grp[COL_SAFETY_CAR].fillna(False)]
-        if COL_RAIN in grp.columns:
-            filtered_grp = filtered_grp[~filtered_grp[COL_RAIN].fillna(False)]
-        if "pit_stop" in filtered_grp.columns:
-            filtered_grp = filtered_grp[~filtered_grp["pit_stop"].fillna(False)]
-        if COL_PACE_MODE in filtered_grp.columns:
+    # Per-compound design columns; all fits of one cascade stage are solved
+    # together with a single batched normal-equations call.
+    data: Dict[str, np.ndarray] = {}
+    base_conditions: Dict[str, Tuple[float, float]] = {}
+    for gi in np.flatnonzero(eligible):
+        comp_raw = group_names[gi]
+        idx = order[bounds[gi] : bounds[gi + 1]]
+        idx = idx[~excluded[idx]]
+        if pace_codes is not None:
             # Keep laps from the dominant pace mode of this compound — filters out
             # isolated attack/warm-up outlier laps without discarding the entire stint.
             # If the dominant mode covers < 5 laps, fall back to excluding only the
             # two most aggressive modes (Attack, Aggressive) which create artificially
             # high wear/time variance that skews the degradation slope.
-            mode_counts = filtered_grp[COL_PACE_MODE].value_counts()
-            if not mode_counts.empty:
-                dominant_mode = mode_counts.index[0]
-                dominant_laps = filtered_grp[filtered_grp[COL_PACE_MODE] == dominant_mode]
-                if len(dominant_laps) >= 5 and dominant_laps["tire_age"].nunique() >= 2:
-                    filtered_grp = dominant_laps
+            pace_grp = pace_codes[idx]
+            present = pace_grp[pace_grp >= 0]
+            if len(present):
+                # Most frequent mode; ties go to the first one seen (value_counts order)
+                modes, first_seen, counts = np.unique(
+                    present, return_index=True, return_counts=True
+                )
+                by_first = np.argsort(first_seen, kind="stable")
+                dominant = modes[by_first[np.argmax(counts[by_first])]]
+                dominant_idx = idx[pace_grp == dominant]
+                if len(dominant_idx) >= 5 and _n_ages(dominant_idx) >= 2:
+                    idx = dominant_idx
                 else:
                     # Fallback: exclude only Attack and Aggressive
-                    filtered_grp = filtered_grp[
-                        ~filtered_grp[COL_PACE_MODE].isin(["Attack", "Aggressive"])
-                    ]
+                    idx = idx[~aggressive[idx]]
 
         # If we don't have enough data after filtering, skip this compound
-        if len(filtered_grp) < 5 or filtered_grp["tire_age"].nunique() < 2:
+        if len(idx) < 5 or _n_ages(idx) < 2:
             continue
-
-        cols = ["tire_age", "lap_time_s"]
-        if fuel_available and "fuel" in filtered_grp.columns:
-            cols.append("fuel")
-        if temp_available and _temp_col in filtered_grp.columns:
-            cols.append(_temp_col)
-        dfc = filtered_grp[cols].dropna()
-        if len(dfc) < 5:
+        idx = idx[complete[idx]]
+        if len(idx) < 5:
             continue
-        z = (dfc["lap_time_s"] - dfc["lap_time_s"].mean()) / (
-            dfc["lap_time_s"].std(ddof=0) or 1
-        )
-        dfc = dfc[np.abs(z) < 3]
-        if len(dfc) < 5:
+        # Drop |z| >= 3 outliers (deviations computed once for std and mask)
+        dev = block[idx, -1]
+        dev -= dev.mean()
+        sd = float(np.sqrt(dev @ dev / len(dev))) or 1.0
+        idx = idx[np.abs(dev) < 3.0 * sd]
+        if len(idx) < 5:
             continue
-        X_age = dfc["tire_age"].values.astype(float)
-        y = dfc["lap_time_s"].values.astype(float)
-        has_fuel = fuel_available and "fuel" in dfc.columns
-        has_temp = temp_available and _temp_col in dfc.columns
-
-        def _lap_base(a: float, c_fuel: float = 0.0, d_temp: float = 0.0) -> float:
-            """Predicted base lap time at mean conditions (first lap, lap age=0)."""
-            base_fuel = float(dfc["fuel"].mean()) if has_fuel and "fuel" in dfc.columns else 0.0
-            base_temp = float(dfc[_temp_col].mean()) if has_temp and _temp_col in dfc.columns else 0.0
-            return a + c_fuel * base_fuel + d_temp * base_temp
-
-        def _coef_valid(a: float, b_age: float, c_fuel: float = 0.0, d_temp: float = 0.0) -> bool:
-            """Physical sanity: predicted base time realistic, coefficients in range."""
-            if not (55.0 <= _lap_base(a, c_fuel, d_temp) <= 220.0):
-                return False
-            if not (-1.0 <= b_age <= 10.0):
-                return False
-            if abs(c_fuel) > 1.0:  # >1 s/kg is unrealistic (F1 is ~0.03-0.07)
-                return False
-            if abs(d_temp) > 3.0:  # >3 s/°C is unrealistic
-                return False
-            return True
-
-        if has_fuel and has_temp:
-            fuel = dfc["fuel"].values.astype(float)
-            temp = dfc[_temp_col].values.astype(float)
-            A = np.column_stack([np.ones_like(X_age), X_age, fuel, temp])  # type: ignore[call-overload]
-            coef, *_ = np.linalg.lstsq(A, y, rcond=None)  # type: ignore[call-overload]
-            a, b_age, c_fuel, d_temp = map(float, coef)
-            if _coef_valid(a, b_age, c_fuel, d_temp):
-                models[comp] = (a, b_age, c_fuel, d_temp)
-                continue
-            # 4-param invalid → try 3-param (drop temp)
-            has_temp = False
-
-        if has_fuel and not has_temp:
-            fuel = dfc["fuel"].values.astype(float)
-            A = np.column_stack([np.ones_like(X_age), X_age, fuel])  # type: ignore[call-overload]
-            coef, *_ = np.linalg.lstsq(A, y, rcond=None)  # type: ignore[call-overload]
-            a, b_age, c_fuel = map(float, coef)
-            if _coef_valid(a, b_age, c_fuel):
-                models[comp] = (a, b_age, c_fuel)
-                continue
-            # 3-param invalid → fall back to 2-param
-        elif has_temp and not has_fuel:
-            temp = dfc[_temp_col].values.astype(float)
-            A = np.column_stack([np.ones_like(X_age), X_age, temp])  # type: ignore[call-overload]
-            coef, *_ = np.linalg.lstsq(A, y, rcond=None)  # type: ignore[call-overload]
-            a, b_age, d_temp = map(float, coef)
-            if _coef_valid(a, b_age, 0.0, d_temp):
-                models[comp] = (a, b_age, 0.0, d_temp)  # c_fuel placeholder = 0.0
-                continue
-            # temp-only 3-param invalid → fall back to 2-param
-
-        # 2-param fallback (always store something if data is available)
-        A = np.column_stack([np.ones_like(X_age), X_age])  # type: ignore[call-overload]
-        coef, *_ = np.linalg.lstsq(A, y, rcond=None)  # type: ignore[call-overload]
-        a, b_age = map(float, coef)
-        if not _coef_valid(a, b_age):
+        rows = block[idx]
+        comp = str(comp_raw)
+        data[comp] = rows
+        # Predicted base lap time is checked at the mean conditions of the fit
+        base_conditions[comp] = (
+            float(rows[:, cols.index("fuel") + 1].mean()) if fuel_available else 0.0,
+            float(rows[:, cols.index(_temp_col) + 1].mean()) if temp_available else 0.0,
+        )
+
+    def _coef_valid(
+        comp: str, a: float, b_age: float, c_fuel: float = 0.0, d_temp: float = 0.0
+    ) -> bool:
+        """Physical sanity: predicted base time realistic, coefficients in range."""
+        base_fuel, base_temp = base_conditions[comp]
+        if not (55.0 <= a + c_fuel * base_fuel + d_temp * base_temp <= 220.0):
+            return False
+        if not (-1.0 <= b_age <= 10.0):
+            return False
+        if abs(c_fuel) > 1.0:  # >1 s/kg is unrealistic (F1 is ~0.03-0.07)
+            return False
+        if abs(d_temp) > 3.0:  # >3 s/°C is unrealistic
+            return False
+        return True
+
+    def _fit_stage(comps: List[str], n_extra: int) -> Dict[str, List[float]]:
+        """Fit ``a + b*age`` plus the first ``n_extra`` columns after age."""
+        if not n_extra:
+            return {c: list(_fit_line(data[c][:, 1], data[c][:, -1])) for c in comps}
+        designs = [data[c][:, : 2 + n_extra] for c in comps]
+        coefs = _solve_ols_batched(designs, [data[c][:, -1] for c in comps])
+        return {c: [float(v) for v in coef] for c, coef in zip(comps, coefs)}
+
+    fitted: Dict[
+        str,
+        Union[
+            Tuple[float, float],
+            Tuple[float, float, float],
+            Tuple[float, float, float, float],
+        ],
+    ] = {}
+    fuel_only: List[str] = []
+    temp_only: List[str] = []
+    if fuel_available and temp_available:
+        for comp, (a, b_age, c_fuel, d_temp) in _fit_stage(list(data), 2).items():
+            if _coef_valid(comp, a, b_age, c_fuel, d_temp):
+                fitted[comp] = (a, b_age, c_fuel, d_temp)
+            else:
+                # 4-param invalid → try 3-param (drop temp)
+                fuel_only.append(comp)
+    elif fuel_available:
+        fuel_only = list(data)
+    elif temp_available:
+        temp_only = list(data)
+
+    for comp, (a, b_age, c_fuel) in _fit_stage(fuel_only, 1).items():
+        if _coef_valid(comp, a, b_age, c_fuel):
+            fitted[comp] = (a, b_age, c_fuel)
+        # 3-param invalid → fall back to 2-param
+    for comp, (a, b_age, d_temp) in _fit_stage(temp_only, 1).items():
+        if _coef_valid(comp, a, b_age, 0.0, d_temp):
+            fitted[comp] = (a, b_age, 0.0, d_temp)  # c_fuel placeholder = 0.0
+        # temp-only 3-param invalid → fall back to 2-param
+
+    # 2-param fallback (always store something if data is available)
+    for comp, (a, b_age) in _fit_stage([c for c in data if c not in fitted], 0).items():
+        if not _coef_valid(comp, a, b_age):
             # El slope es físicamente imposible (e.g. b_age muy negativo por vueltas
             # en modo Light sin variación real de degradación). Mantenemos el intercept
             # OLS (que está en la misma escala de referencia que los modelos 4-param)
             # y seteamos b_age=0 → modelo plano conservador.
             b_age = 0.0
-        models[comp] = (a, b_age)
+        fitted[comp] = (a, b_age)
+
+    # Keep compound order independent of which cascade stage produced each fit
+    for comp in data:
+        models[comp] = fitted[comp]
     return models
 
 
+@lru_cache(maxsize=32)
+def _fit_practice_models_cached(
+    data_root: str,
+    track: str,
+    driver: str,
+    sources_key: Tuple[Tuple[str, int], ...],
+) -> Dict[
+    str,
+    Union[
+        Tuple[float, float],
+        Tuple[float, float, float],
+        Tuple[float, float, float, float],
+    ],
+]:
+    """Collect and fit once per distinct set of source files (see caller)."""
+    practice = collect_practice_data(Path(data_root), track, driver, sources_key)
+    return fit_degradation_model(practice)
+
+
+def fit_practice_models(
+    data_root: Path, track: str, driver: str
+) -> Dict[
+    str,
+    Union[
+        Tuple[float, float],
+        Tuple[float, float, float],
+        Tuple[float, float, float, float],
+    ],
+]:
+    """Fit degradation models from the practice data of ``driver`` at ``track``.
+
+    Results are memoized on ``(track, driver, source file mtimes)``: repeated
+    calls with unchanged inputs skip both the data collection and the fits,
+    and touching any of the driver's practice Parquet or CSV files invalidates
+    the entry. The key is listed once and handed to ``collect_practice_data``.
+    """
+    sources_key = practice_sources_key(data_root, track, driver)
+    return dict(_fit_practice_models_cached(str(data_root), track, driver, sources_key))
+
+
 def stint_time(intercept: float, slope: float, laps: int) -> float:
     if laps <= 0:
         return 0.0
     return laps * intercept + slope * (laps - 1) * laps / 2.0
 
 
+# float in, float out; ndarray in, ndarray out
+_LapTimes = TypeVar("_LapTimes", float, np.ndarray)
+
+
 def adjust_lap_time_for_conditions(
-    base_lap_time: float, safety_car: bool = False, rain: bool = False
-) -> float:
+    base_lap_time: _LapTimes, safety_car: bool = False, rain: bool = False
+) -> _LapTimes:
     """Adjust lap time based on Safety Car or rain conditions.
 
     Args:
-        base_lap_time: Base lap time from degradation model
+        base_lap_time: Base lap time from degradation model, or an array of
+            lap times (e.g. a whole stint) adjusted in one multiply
         safety_car: Whether Safety Car is deployed
         rain: Whether it's raining
 
     Returns:
-        Adjusted lap time considering conditions
+        Adjusted lap time(s) considering conditions
     """
-    multiplier = 1.0
-
-    if safety_car:
-        multiplier *= SAFETY_CAR_TIME_MULTIPLIER
-    if rain:
-        multiplier *= RAIN_TIME_MULTIPLIER
-
+    multiplier = (SAFETY_CAR_TIME_MULTIPLIER if safety_car else 1.0) * (
+        RAIN_TIME_MULTIPLIER if rain else 1.0
+    )
     return base_lap_time * multiplier
 
 
@@ -244,10 +400,49 @@ def max_stint_length(
     driver: str = "",
     research_root: "Path | None" = None,
 ) -> int:
-    # Normalise both the lookup key and the data column so "C3"/"C4" → "Soft"
-    compound = canonical_compound(compound)
-    canonical_col = practice_laps["compound"].apply(canonical_compound)
-    subset = practice_laps[canonical_col == compound]
+    return max_stint_lengths(
+        practice_laps, [compound], driver=driver, research_root=research_root
+    )[compound]
+
+
+def max_stint_lengths(
+    practice_laps: pd.DataFrame,
+    compounds: List[str],
+    driver: str = "",
+    research_root: "Path | None" = None,
+) -> Dict[str, int]:
+    """``max_stint_length`` for several compounds with one pass over the data.
+
+    The compound column is canonicalised once per distinct value and split
+    with a single groupby instead of a filtered scan per compound.
+    """
+    # Normalise both the lookup keys and the data column so "C3"/"C4" → "Soft"
+    raw_codes, raw_uniques = pd.factorize(
+        practice_laps["compound"], use_na_sentinel=False
+    )
+    canonical_uniques = np.array(
+        [canonical_compound(u) for u in raw_uniques], dtype=object
+    )
+    canonical = canonical_uniques[raw_codes]
+    positions = practice_laps.groupby(canonical, sort=False).indices
+    empty = np.empty(0, dtype=np.intp)
+    return {
+        comp: _max_stint_from_subset(
+            practice_laps.iloc[positions.get(canonical_compound(comp), empty)],
+            canonical_compound(comp),
+            driver,
+            research_root,
+        )
+        for comp in compounds
+    }
+
+
+def _max_stint_from_subset(
+    subset: pd.DataFrame,
+    compound: str,
+    driver: str,
+    research_root: "Path | None",
+) -> int:
     if subset.empty:
         return 25
 
@@ -269,11 +464,10 @@ def max_stint_length(
         wear_data = wear_data[wear_data[COL_AVG_WEAR] > 0]
 
         if len(wear_data) >= 3 and wear_data["tire_age"].nunique() >= 2:
-            _ages_w = np.array(wear_data["tire_age"].values, dtype=float)
-            X_w = np.column_stack([np.ones(len(_ages_w)), _ages_w])
-            y_w = wear_data[COL_AVG_WEAR].values.astype(float)
-            coef_w, *_ = np.linalg.lstsq(X_w, y_w, rcond=None)  # type: ignore[call-overload]
-            a_w, b_w = float(coef_w[0]), float(coef_w[1])
+            a_w, b_w = _fit_line(
+                wear_data["tire_age"].to_numpy(dtype=np.float64),
+                wear_data[COL_AVG_WEAR].to_numpy(dtype=np.float64),
+            )
 
             # Detect dominant paceMode and scale b_w to Standard-equivalent.
             # Priority: calibrated driver scale from research DB > hardcoded PACE_WEAR_SCALE.
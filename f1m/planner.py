@@ -1,12 +1,15 @@
 """Planificador:
-- `enumerate_plans`: backtracking para enumerar planes (stints) con límites.
+- `enumerate_plans`: programación dinámica para enumerar planes (stints) con límites.
 - `live_pit_recommendation`: ventana local que sugiere vuelta de parada y compuesto.
 Incluye chequeos de viabilidad por combustible cuando hay modelo con fuel.
 """
 
 from __future__ import annotations
 
-from functools import lru_cache
+import bisect
+import heapq
+from dataclasses import dataclass
+from operator import itemgetter
 from pathlib import Path
 
 from .common import canonical_compound, display_compound
@@ -25,7 +28,432 @@ from .imports import (
     np,
     pd,
 )
-from .modeling import adjust_lap_time_for_conditions, max_stint_length, stint_time
+from .modeling import adjust_lap_time_for_conditions, max_stint_lengths
+
+try:
+    from numba import njit
+
+    _NUMBA_AVAILABLE = True
+except ImportError:
+    njit = None
+    _NUMBA_AVAILABLE = False
+
+
+def _stint_times(
+    coeffs: Tuple[float, ...],
+    laps: np.ndarray,
+    fuel_start: np.ndarray,
+    use_fuel: bool,
+    cons_per_lap: float,
+    race_temp: float,
+    check_fuel: bool = True,
+) -> Optional[np.ndarray]:
+    """Closed-form stint times for ``laps[i]`` laps starting with ``fuel_start[i]``.
+
+    Element-wise (broadcasting) sum over ages ``0..laps-1`` of
+    ``a + b*age (+ c*fuel)``. With ``check_fuel`` fuel-infeasible stints
+    (fuel dropping below zero) are ``inf``. Returns ``None`` for malformed
+    coefficient tuples.
+    """
+    c_fuel: Optional[float] = None
+    if len(coeffs) == 4:
+        a, b_age, c4, d_temp = coeffs
+        a = a + d_temp * race_temp
+        if use_fuel and c4 != 0.0:
+            c_fuel = c4
+    elif use_fuel and len(coeffs) == 3:
+        a, b_age, c_fuel = coeffs
+    elif len(coeffs) >= 2:
+        a, b_age = coeffs[0], coeffs[1]
+    else:
+        return None
+    n = laps.astype(np.float64)
+    tri = n * (n - 1) / 2.0  # sum of ages 0..n-1
+    times = n * a + b_age * tri
+    if c_fuel is not None:
+        times = times + c_fuel * (n * fuel_start - cons_per_lap * tri)
+        if check_fuel:
+            fuel_end = fuel_start - cons_per_lap * (n - 1)
+            feasible = (fuel_start >= 0) & (fuel_end >= 0)
+            times = np.where(feasible, times, np.inf)
+    return np.where(n > 0, times, 0.0)
+
+
+# Relative tolerance under which two candidate times count as a tie
+_TIE_RTOL = 1e-9
+
+
+def _argmin_first(values: np.ndarray, axis: int = 0) -> np.ndarray:
+    """``np.argmin`` treating values within ``_TIE_RTOL`` of the minimum as ties.
+
+    Returns the first such index, so closed-form sums that differ only by
+    rounding keep the earlier candidate.
+    """
+    lowest = values.min(axis=axis, keepdims=True)
+    return np.argmax(np.isclose(values, lowest, rtol=_TIE_RTOL, atol=0.0), axis=axis)
+
+
+@dataclass(frozen=True)
+class _PlanBound:
+    """Admissible lower bound used to prune partial plans.
+
+    Every stint costs at least ``lap_rate`` per lap, so finishing ``remaining``
+    laps costs at least ``remaining * lap_rate`` plus the pit losses of the
+    stops still to come. ``final_stints`` (0 = any) and ``require_mixed``
+    mirror the filters applied to finished plans.
+    """
+
+    lap_rate: float
+    pit_loss: float
+    final_stints: int
+    require_mixed: bool
+
+    def remaining(self, laps: int, n_stints: int, max_stints: int) -> float:
+        # A plan with ``n_stints`` placed and laps left ends with at least
+        # ``n_stints`` stops (and at most ``max_stints - 1``)
+        stops = n_stints if self.pit_loss >= 0 else max_stints - 1
+        return laps * self.lap_rate + self.pit_loss * stops
+
+    def limit(self, kth_total: float) -> float:
+        # Small slack so float rounding never prunes a plan that ties
+        return kth_total + 1e-9 * max(1.0, abs(kth_total))
+
+    def accepts(self, n_stints: int, mixed: bool) -> bool:
+        if self.require_mixed and not mixed:
+            return False
+        return self.final_stints == 0 or n_stints == self.final_stints
+
+
+def _final_labels_python(
+    cost: List[List[List[float]]],
+    compounds: List[str],
+    max_len: Mapping[str, int],
+    race_laps: int,
+    min_stint: int,
+    max_stints: int,
+    top_k: int,
+    bound: _PlanBound,
+) -> Dict[Tuple[int, str, bool], List[Tuple[float, Tuple[Tuple[str, int], ...]]]]:
+    """Pure-Python forward DP; returns the labels of the final-lap states.
+
+    Each state holds its ``top_k`` cheapest prefixes as a sorted list of
+    ``(time, stints)`` with stints as ``(compound index, laps)`` pairs, so equal
+    times are ordered by their stints exactly like the compiled kernel. A worse
+    candidate is rejected on arrival and buckets never grow past ``top_k``.
+    States are keyed on small ints ``(stints, last compound index, mixed)``,
+    with -1 before the first stint, like the compiled kernel.
+    """
+    IndexLabel = Tuple[float, Tuple[Tuple[int, int], ...]]
+    layers: List[Dict[Tuple[int, int, bool], List[IndexLabel]]] = [
+        {} for _ in range(race_laps + 1)
+    ]
+    layers[0][(0, -1, False)] = [(0.0, ())]
+    comp_max_len = [max_len.get(comp, race_laps) for comp in compounds]
+    # Negated totals (pit loss included) of the best valid plans finished so far
+    finished_heap: List[float] = []
+
+    for laps_done in range(race_laps):
+        remaining = race_laps - laps_done
+        min_laps = max(1, min_stint if remaining > min_stint else remaining)
+        for (n_stints, last_ci, mixed), labels in layers[laps_done].items():
+            if n_stints >= max_stints:
+                continue
+            if len(finished_heap) == top_k:
+                # Branch and bound: drop prefixes that cannot beat the k-th plan
+                limit = bound.limit(-finished_heap[0]) - bound.remaining(
+                    remaining, n_stints, max_stints
+                )
+                labels = [label for label in labels if label[0] <= limit]
+                if not labels:
+                    continue
+            for ci in range(len(compounds)):
+                stint_costs = cost[ci][laps_done]
+                if ci == last_ci and n_stints >= 2:
+                    # Avoid consecutive same compound after the second stint
+                    continue
+                max_l = min(comp_max_len[ci], remaining)
+                new_mixed = mixed or (last_ci >= 0 and ci != last_ci)
+                for laps in range(min_laps, max_l + 1):
+                    if remaining - laps > 0 and remaining - laps < min_stint:
+                        continue
+
+                    stint_time_val = stint_costs[laps]
+                    if stint_time_val == float("inf"):
+                        continue  # Fuel constraint violated
+
+                    bucket = layers[laps_done + laps].setdefault(
+                        (n_stints + 1, ci, new_mixed), []
+                    )
+                    for t, prefix in labels:
+                        entry = (t + stint_time_val, prefix + ((ci, laps),))
+                        if len(bucket) == top_k:
+                            if entry >= bucket[-1]:
+                                break  # labels are sorted, the rest are no cheaper
+                            bucket.pop()
+                        bisect.insort(bucket, entry)
+                    if laps == remaining and bound.accepts(n_stints + 1, new_mixed):
+                        pits = bound.pit_loss * n_stints
+                        for t, _prefix in labels:
+                            total = -(t + stint_time_val + pits)
+                            if len(finished_heap) < top_k:
+                                heapq.heappush(finished_heap, total)
+                            elif total > finished_heap[0]:
+                                heapq.heapreplace(finished_heap, total)
+    return {
+        (n_stints, compounds[last_ci], mixed): [
+            (t, tuple((compounds[c], laps) for c, laps in prefix))
+            for t, prefix in labels
+        ]
+        for (n_stints, last_ci, mixed), labels in layers[race_laps].items()
+        if last_ci >= 0
+    }
+
+
+def _fill_stints(
+    bp_comp: np.ndarray,
+    bp_mixed: np.ndarray,
+    bp_rank: np.ndarray,
+    bp_laps: np.ndarray,
+    at: int,
+    n_stints: int,
+    comp: int,
+    mixed: int,
+    rank: int,
+    out: np.ndarray,
+) -> None:
+    """Write the stints of a kernel label into ``out`` as (compound, laps) rows."""
+    while n_stints > 0:
+        laps = bp_laps[at, n_stints, comp, mixed, rank]
+        out[n_stints - 1, 0] = comp
+        out[n_stints - 1, 1] = laps
+        prev_comp = bp_comp[at, n_stints, comp, mixed, rank]
+        prev_mixed = bp_mixed[at, n_stints, comp, mixed, rank]
+        prev_rank = bp_rank[at, n_stints, comp, mixed, rank]
+        at -= laps
+        n_stints -= 1
+        comp = prev_comp
+        mixed = prev_mixed
+        rank = prev_rank
+
+
+def _stints_before(a: np.ndarray, b: np.ndarray, n_stints: int) -> bool:
+    """Whether the first ``n_stints`` rows of ``a`` sort before those of ``b``."""
+    for i in range(n_stints):
+        for j in range(2):
+            if a[i, j] != b[i, j]:
+                return a[i, j] < b[i, j]
+    return False
+
+
+def _plan_dp_kernel(
+    cost: np.ndarray,
+    max_len: np.ndarray,
+    race_laps: int,
+    min_stint: int,
+    max_stints: int,
+    top_k: int,
+    lap_rate: float,
+    pit_loss: float,
+    final_stints: int,
+    require_mixed: bool,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Array version of the forward DP in ``enumerate_plans``.
+
+    ``cost[ci, laps_done, laps]`` is the stint cost table. States are indexed
+    ``[laps_done, n_stints, last_comp, mixed, rank]`` where ``last_comp ==
+    n_compounds`` means "no stint yet"; each keeps its ``top_k`` cheapest
+    prefixes sorted by time plus back-pointers (previous compound, previous
+    mixed flag, previous rank, stint laps) to rebuild the plan. Prefixes are
+    pruned with the same bound as ``_PlanBound`` (passed as scalars). Equal
+    times are ordered by their stints, rebuilt from the back-pointers, so the
+    kept prefixes match ``_final_labels_python``. Only uses integer/float
+    arrays so it can be compiled with Numba.
+    """
+    n_comp = cost.shape[0]
+    shape = (race_laps + 1, max_stints + 1, n_comp + 1, 2, top_k)
+    best = np.full(shape, np.inf)
+    bp_comp = np.full(shape, -1, dtype=np.int16)
+    bp_mixed = np.zeros(shape, dtype=np.int8)
+    bp_rank = np.zeros(shape, dtype=np.int16)
+    bp_laps = np.zeros(shape, dtype=np.int16)
+    best[0, 0, n_comp, 0, 0] = 0.0
+    # Sorted totals (pit loss included) of the best valid finished plans
+    finished = np.full(top_k, np.inf)
+    # Scratch rows for comparing the stints of two labels with equal times
+    cand = np.zeros((max_stints, 2), dtype=np.int64)
+    other = np.zeros((max_stints, 2), dtype=np.int64)
+
+    for laps_done in range(race_laps):
+        remaining = race_laps - laps_done
+        min_laps = min_stint if remaining > min_stint else remaining
+        if min_laps < 1:
+            min_laps = 1
+        for n_stints in range(max_stints):
+            stops_left = n_stints if pit_loss >= 0 else max_stints - 1
+            rest_bound = remaining * lap_rate + pit_loss * stops_left
+            for last in range(n_comp + 1):
+                for mixed in range(2):
+                    for rank in range(top_k):
+                        base = best[laps_done, n_stints, last, mixed, rank]
+                        if base == np.inf:
+                            break
+                        kth = finished[top_k - 1]
+                        if kth < np.inf:
+                            slack = 1e-9 * max(1.0, abs(kth))
+                            if base + rest_bound > kth + slack:
+                                break  # later ranks are no cheaper
+                        for ci in range(n_comp):
+                            if ci == last and n_stints >= 2:
+                                continue
+                            max_l = min(max_len[ci], remaining)
+                            new_mixed = mixed
+                            if last != n_comp and ci != last:
+                                new_mixed = 1
+                            for laps in range(min_laps, max_l + 1):
+                                left = remaining - laps
+                                if left > 0 and left < min_stint:
+                                    continue
+                                c = cost[ci, laps_done, laps]
+                                if c == np.inf:
+                                    continue
+                                total = base + c
+                                if (
+                                    left == 0
+                                    and (new_mixed == 1 or not require_mixed)
+                                    and (
+                                        final_stints == 0
+                                        or n_stints + 1 == final_stints
+                                    )
+                                ):
+                                    done = total + pit_loss * n_stints
+                                    if done < finished[top_k - 1]:
+                                        pos = top_k - 1
+                                        while pos > 0 and finished[pos - 1] > done:
+                                            finished[pos] = finished[pos - 1]
+                                            pos -= 1
+                                        finished[pos] = done
+                                to = laps_done + laps
+                                row = best[to, n_stints + 1, ci, new_mixed]
+                                if total > row[top_k - 1]:
+                                    continue
+                                # Sorted insert by (time, stints); the stints are
+                                # rebuilt from the back-pointers only on equal times
+                                tied = False
+                                pos = top_k
+                                while pos > 0:
+                                    prev = row[pos - 1]
+                                    if prev < total:
+                                        break
+                                    if prev == total:
+                                        if not tied:
+                                            tied = True
+                                            _fill_stints(
+                                                bp_comp,
+                                                bp_mixed,
+                                                bp_rank,
+                                                bp_laps,
+                                                laps_done,
+                                                n_stints,
+                                                last,
+                                                mixed,
+                                                rank,
+                                                cand,
+                                            )
+                                            cand[n_stints, 0] = ci
+                                            cand[n_stints, 1] = laps
+                                        _fill_stints(
+                                            bp_comp,
+                                            bp_mixed,
+                                            bp_rank,
+                                            bp_laps,
+                                            to,
+                                            n_stints + 1,
+                                            ci,
+                                            new_mixed,
+                                            pos - 1,
+                                            other,
+                                        )
+                                        if not _stints_before(
+                                            cand, other, n_stints + 1
+                                        ):
+                                            break
+                                    pos -= 1
+                                if pos == top_k:
+                                    continue  # no cheaper than the kept labels
+                                r_comp = bp_comp[to, n_stints + 1, ci, new_mixed]
+                                r_mixed = bp_mixed[to, n_stints + 1, ci, new_mixed]
+                                r_rank = bp_rank[to, n_stints + 1, ci, new_mixed]
+                                r_laps = bp_laps[to, n_stints + 1, ci, new_mixed]
+                                for j in range(top_k - 1, pos, -1):
+                                    row[j] = row[j - 1]
+                                    r_comp[j] = r_comp[j - 1]
+                                    r_mixed[j] = r_mixed[j - 1]
+                                    r_rank[j] = r_rank[j - 1]
+                                    r_laps[j] = r_laps[j - 1]
+                                row[pos] = total
+                                r_comp[pos] = last
+                                r_mixed[pos] = mixed
+                                r_rank[pos] = rank
+                                r_laps[pos] = laps
+    return best, bp_comp, bp_mixed, bp_rank, bp_laps
+
+
+if _NUMBA_AVAILABLE:
+    _fill_stints = njit(cache=True)(_fill_stints)
+    _stints_before = njit(cache=True)(_stints_before)
+    _plan_dp_kernel = njit(cache=True)(_plan_dp_kernel)
+
+
+def _final_labels_numba(
+    cost: np.ndarray,
+    compounds: List[str],
+    max_len: np.ndarray,
+    race_laps: int,
+    min_stint: int,
+    max_stints: int,
+    top_k: int,
+    bound: _PlanBound,
+) -> Dict[Tuple[int, str, bool], List[Tuple[float, Tuple[Tuple[str, int], ...]]]]:
+    """Run the compiled DP and rebuild the labels of the final-lap states."""
+    best, bp_comp, bp_mixed, bp_rank, bp_laps = _plan_dp_kernel(
+        cost,
+        max_len,
+        race_laps,
+        min_stint,
+        max_stints,
+        top_k,
+        bound.lap_rate,
+        bound.pit_loss,
+        bound.final_stints,
+        bound.require_mixed,
+    )
+    n_comp = len(compounds)
+    final: Dict[
+        Tuple[int, str, bool], List[Tuple[float, Tuple[Tuple[str, int], ...]]]
+    ] = {}
+    for n_stints in range(1, max_stints + 1):
+        for last in range(n_comp):
+            for mixed in range(2):
+                for rank in range(top_k):
+                    total = float(best[race_laps, n_stints, last, mixed, rank])
+                    if total == np.inf:
+                        break
+                    stints: List[Tuple[str, int]] = []
+                    state = (race_laps, n_stints, last, mixed, rank)
+                    while state[1] > 0:
+                        laps = int(bp_laps[state])
+                        stints.append((compounds[state[2]], laps))
+                        state = (
+                            state[0] - laps,
+                            state[1] - 1,
+                            int(bp_comp[state]),
+                            int(bp_mixed[state]),
+                            int(bp_rank[state]),
+                        )
+                    final.setdefault(
+                        (n_stints, compounds[last], bool(mixed)), []
+                    ).append((total, tuple(reversed(stints))))
+    return final
 
 
 def enumerate_plans(
@@ -58,191 +486,140 @@ def enumerate_plans(
     """Devuelve los `top_k` mejores planes por tiempo total estimado.
 
     The plan is a list of (compound, laps) stints whose laps sum to ``race_laps``.
-    This function validates fuel feasibility when ``use_fuel`` is enabled and uses
-    ``stint_time`` to compute expected stint durations.
+    This function validates fuel feasibility when ``use_fuel`` is enabled. Every
+    (compound, laps already run, stint length) cost, fuel path included, is
+    computed once into a table that all partial plans share.
 
-    Optimized with memoization to avoid exponential recursion.
+    Uses a forward dynamic program over laps completed that keeps only the
+    ``top_k`` cheapest partial plans per state, so the work grows linearly
+    with ``race_laps`` instead of enumerating every stint combination.
     """
 
     plans: List[dict] = []
-    max_len = {
-        c: max_stint_length(
-            practice_laps, c, driver=driver, research_root=research_root
+    if top_k <= 0:
+        return plans
+    max_len = max_stint_lengths(
+        practice_laps, compounds, driver=driver, research_root=research_root
+    )
+
+    # Stint cost table: cost_table[ci, laps_done, laps] is the condition-adjusted
+    # time of a ``laps``-long stint on ``compounds[ci]`` starting after
+    # ``laps_done`` laps (fuel on board depends only on laps already run).
+    # Built once with closed-form sums instead of np.arange/np.sum per stint.
+    laps_axis = np.arange(race_laps + 1)
+    fuel_at = (start_fuel - cons_per_lap * laps_axis)[:, None]
+    sc_laps = (laps_axis * safety_car_percentage).astype(int)
+    rain_laps = (laps_axis * rain_percentage).astype(int)
+    normal_laps = laps_axis - sc_laps - rain_laps
+    # Assume conditions apply to a percentage of laps in the stint
+    cond_factor = (
+        normal_laps
+        + sc_laps * adjust_lap_time_for_conditions(1.0, safety_car=True)
+        + rain_laps * adjust_lap_time_for_conditions(1.0, rain=True)
+    ) / np.maximum(laps_axis, 1)
+    cost_table = np.full((len(compounds), race_laps + 1, race_laps + 1), np.inf)
+    pred_rows: Dict[str, List[float]] = {}
+    for ci, comp in enumerate(compounds):
+        coeffs = models.get(comp)
+        times: Optional[np.ndarray] = None
+        if coeffs is not None:
+            times = _stint_times(
+                coeffs, laps_axis[None, :], fuel_at, use_fuel, cons_per_lap, race_temp
+            )
+        if coeffs is None or times is None:
+            continue
+        cost_table[ci] = times * cond_factor
+        # Displayed per-stint prediction: unadjusted, evaluated at start_fuel
+        pred = _stint_times(
+            coeffs,
+            laps_axis,
+            np.full(race_laps + 1, start_fuel),
+            use_fuel,
+            cons_per_lap,
+            race_temp,
+            check_fuel=False,
         )
-        for c in compounds
-    }
-
-    @lru_cache(maxsize=None)
-    def compute_stint_time(
-        comp: str, laps: int, fuel_cursor: float
-    ) -> Tuple[float, float]:
-        """Compute stint time and updated fuel. Memoized for performance."""
-        if comp not in models:
-            return float("inf"), fuel_cursor
-        coeffs = models[comp]
-        if len(coeffs) == 4:
-            a, b_age, c_fuel, d_temp = coeffs
-            a_eff = a + d_temp * race_temp
-            ages = np.arange(0, laps)
-            if use_fuel and c_fuel != 0.0:
-                fuel_series = fuel_cursor - cons_per_lap * ages
-                if (fuel_series < 0).any():
-                    return float("inf"), fuel_cursor
-                stint_time_val = float(
-                    np.sum(a_eff + b_age * ages + c_fuel * fuel_series)
-                )
-            else:
-                stint_time_val = stint_time(a_eff, b_age, laps)
-            new_fuel = fuel_cursor - cons_per_lap * laps
-        elif use_fuel and len(coeffs) == 3:
-            a, b_age, c_fuel = coeffs
-            ages = np.arange(0, laps)
-            fuel_series = fuel_cursor - cons_per_lap * ages
-            if (fuel_series < 0).any():
-                return float("inf"), fuel_cursor
-            stint_time_val = float(np.sum(a + b_age * ages + c_fuel * fuel_series))
-            new_fuel = fuel_cursor - cons_per_lap * laps
-        else:
-            a, b_age = coeffs[0], coeffs[1]
-            stint_time_val = stint_time(a, b_age, laps)
-            new_fuel = fuel_cursor - cons_per_lap * laps
-
-        # Apply adjustments for Safety Car and rain conditions
-        # Assume conditions apply to a percentage of laps in the stint
-        safety_car_laps = int(laps * safety_car_percentage)
-        rain_laps = int(laps * rain_percentage)
-        normal_laps = laps - safety_car_laps - rain_laps
-
-        # Calculate adjusted time
-        adjusted_time = (
-            normal_laps * (stint_time_val / laps)
-            + safety_car_laps
-            * adjust_lap_time_for_conditions(stint_time_val / laps, safety_car=True)
-            + rain_laps
-            * adjust_lap_time_for_conditions(stint_time_val / laps, rain=True)
+        if pred is not None:
+            pred_rows[comp] = pred.tolist()
+
+    # Forward DP over laps completed. The fuel at the start of a stint only
+    # depends on how many laps were already run, so a state only needs
+    # (stints placed, last compound, mixed) where ``mixed`` records whether two
+    # different compounds were used. Each state keeps its ``top_k`` cheapest
+    # prefixes, which is enough to recover the global ``top_k`` plans.
+    #
+    # Stint rules match the previous recursive search: the second stint may
+    # repeat the first compound, later stints may not, and a plan may have up
+    # to ``max_stops + 1`` stops (only reachable with ``exact_stops=False``).
+    max_stints = max_stops + 2
+    Label = Tuple[float, Tuple[Tuple[str, int], ...]]
+    StateKey = Tuple[int, str, bool]
+    # With Numba installed the DP runs compiled over the array table; the
+    # list-based version is the fallback.
+    # Cheapest per-lap cost of any stint, for the branch-and-bound pruning
+    per_lap = cost_table[:, :, 1:] / np.arange(1, race_laps + 1)
+    finite = per_lap[np.isfinite(per_lap)]
+    bound = _PlanBound(
+        lap_rate=float(finite.min()) if finite.size else 0.0,
+        pit_loss=float(pit_loss),
+        final_stints=max_stops + 1 if exact_stops else 0,
+        require_mixed=require_two_compounds and race_laps > 15,
+    )
+    final_labels: Dict[StateKey, List[Label]]
+    if _NUMBA_AVAILABLE:
+        max_len_arr = np.array(
+            [max_len.get(comp, race_laps) for comp in compounds], dtype=np.int64
+        )
+        final_labels = _final_labels_numba(
+            cost_table,
+            compounds,
+            max_len_arr,
+            race_laps,
+            min_stint,
+            max_stints,
+            top_k,
+            bound,
+        )
+    else:
+        final_labels = _final_labels_python(
+            cost_table.tolist(),
+            compounds,
+            max_len,
+            race_laps,
+            min_stint,
+            max_stints,
+            top_k,
+            bound,
         )
 
-        return adjusted_time, new_fuel
-
-    def generate_plans_dp(
-        remaining: int,
-        stops_used: int,
-        last_comp: str,
-        fuel_level: float,
-        compounds_used: frozenset,
-    ) -> List[Tuple[List[Tuple[str, int]], float, float]]:
-        """Generate all valid plans for remaining laps using DP with memoization."""
-        # Cache key: (remaining, stops_used, last_comp, fuel_level_rounded, compounds_used)
-        fuel_key = round(fuel_level, 1)  # Round fuel to 0.1 precision for caching
-        cache_key = (remaining, stops_used, last_comp, fuel_key, compounds_used)
-
-        if cache_key in _plan_cache:
-            return _plan_cache[cache_key]
-
-        if remaining == 0:
-            # Valid plan found
-            result: List[Tuple[List[Tuple[str, int]], float, float]] = [
-                ([], 0.0, fuel_level)
-            ]
-            _plan_cache[cache_key] = result
-            return result
-
-        if stops_used > max_stops:
-            _plan_cache[cache_key] = []
-            return []
-
-        results = []
-
-        for comp in compounds:
-            if comp == last_comp and stops_used > 0:
-                # Avoid consecutive same compound unless it's the first stint
-                continue
-
-            max_l = min(max_len.get(comp, remaining), remaining)
-            min_laps = min_stint if remaining > min_stint else remaining
-
-            for laps in range(min_laps, max_l + 1):
-                if remaining - laps > 0 and remaining - laps < min_stint:
-                    continue
-
-                stint_time_val, new_fuel = compute_stint_time(comp, laps, fuel_level)
-                if stint_time_val == float("inf"):
-                    continue  # Fuel constraint violated
-
-                new_compounds_used = compounds_used | {comp}
-
-                # Recursive call for remaining laps
-                sub_plans = generate_plans_dp(
-                    remaining - laps,
-                    stops_used + (1 if stops_used > 0 or last_comp != "" else 0),
-                    comp,
-                    new_fuel,
-                    new_compounds_used,
-                )
-
-                for sub_stints, sub_time, final_fuel in sub_plans:
-                    total_time = stint_time_val + sub_time
-                    new_stints = [(comp, laps)] + sub_stints
-                    results.append((new_stints, total_time, final_fuel))
-
-        _plan_cache[cache_key] = results
-        return results
-
-    # Global cache for this function call
-    _plan_cache: Dict[Tuple[int, int, str, float, frozenset], List] = {}
-
-    # Generate all plans starting with empty state
-    all_plans = generate_plans_dp(race_laps, 0, "", start_fuel, frozenset())
-
-    # Convert to the expected format
-    for stints, total_time, final_fuel in all_plans:
-        if not stints:
+    finished: List[Tuple[float, Tuple[Tuple[str, int], ...], int]] = []
+    for (n_stints, _last, mixed), labels in final_labels.items():
+        if n_stints == 0:
             continue
-
         # Check two-compound requirement
-        if (
-            require_two_compounds
-            and len(set(c for c, _ in stints)) < 2
-            and race_laps > 15
-        ):
+        if require_two_compounds and not mixed and race_laps > 15:
+            continue
+        stops = n_stints - 1
+        if exact_stops and stops != max_stops:
             continue
-
         # Add pit stop losses
-        stops = len(stints) - 1
-        total_time_with_pits = total_time + pit_loss * stops
-
-        details = []
-        for comp, laps in stints:
-            coeffs = models[comp]
-            if len(coeffs) == 4:
-                a, b_age, c_fuel, d_temp = coeffs
-                a_eff = a + d_temp * race_temp
-                ages = np.arange(0, laps)
-                if use_fuel and c_fuel != 0.0:
-                    fuel_series = start_fuel - cons_per_lap * ages
-                    pred_time = float(
-                        np.sum(a_eff + b_age * ages + c_fuel * fuel_series)
-                    )
-                else:
-                    pred_time = stint_time(a_eff, b_age, laps)
-            elif use_fuel and len(coeffs) == 3:
-                a, b_age, c_fuel = coeffs
-                ages = np.arange(0, laps)
-                fuel_series = start_fuel - cons_per_lap * ages
-                pred_time = float(np.sum(a + b_age * ages + c_fuel * fuel_series))
-            else:
-                a, b_age = coeffs[0], coeffs[1]
-                pred_time = stint_time(a, b_age, laps)
-            details.append({"compound": comp, "laps": laps, "pred_time": pred_time})
+        finished.extend((t + pit_loss * stops, stints, stops) for t, stints in labels)
+
+    # Convert to the expected format. Equal totals are ordered by their stints
+    # so the compiled and pure-Python DPs return the same plans in the same order.
+    for total_time_with_pits, stints, stops in heapq.nsmallest(
+        top_k, finished, key=itemgetter(0, 1)
+    ):
+        details = [
+            {"compound": comp, "laps": laps, "pred_time": pred_rows[comp][laps]}
+            for comp, laps in stints
+        ]
 
         plans.append(
             {"stints": details, "total_time": total_time_with_pits, "stops": stops}
         )
 
-    if exact_stops:
-        plans = [p for p in plans if p["stops"] == max_stops]
-    plans.sort(key=lambda x: x["total_time"])
-    return plans[:top_k]
+    return plans
 
 
 def live_pit_recommendation(
@@ -292,90 +669,56 @@ def live_pit_recommendation(
         a_cur, b_cur = cur_coeffs[0], cur_coeffs[1]
         c_cur = None
 
-    evaluations: List[dict] = []
-    for pit_in in range(1, min(window, rem_laps) + 1):
-        ages = np.arange(current_tire_age, current_tire_age + pit_in)
-        try:
-            if use_fuel and c_cur is not None:
-                fuel_seg = current_fuel - cons_per_lap * np.arange(0, pit_in)
-                if (fuel_seg < 0).any():
-                    continue
-                time_current = float(np.sum(a_cur + b_cur * ages + c_cur * fuel_seg))
-                fuel_after = current_fuel - cons_per_lap * pit_in
-            else:
-                time_current = float(np.sum(a_cur + b_cur * ages))
-                fuel_after = current_fuel - cons_per_lap * pit_in
-        except (ValueError, TypeError, RuntimeError):
-            # Skip this pit window if any calculation error occurs
-            continue
-        laps_after = rem_laps - pit_in
-        if laps_after < 0:
-            continue
-        best_comp_alt: Optional[str] = None
-        best_tail_time: Optional[float] = None
-        for comp, coeffs in models.items():
-            try:
-                if len(coeffs) == 4:
-                    _a_n, _b_n, _c_n, _d_n = coeffs
-                    a_new_eff = _a_n + _d_n * race_temp
-                    new_ages = np.arange(0, laps_after)
-                    if laps_after > 0:
-                        if use_fuel and _c_n != 0.0:
-                            fuel_new = fuel_after - cons_per_lap * new_ages
-                            if (fuel_new < 0).any():
-                                continue
-                            time_new = float(
-                                np.sum(a_new_eff + _b_n * new_ages + _c_n * fuel_new)
-                            )
-                        else:
-                            time_new = stint_time(a_new_eff, _b_n, laps_after)
-                    else:
-                        time_new = 0.0
-                elif use_fuel and len(coeffs) == 3:
-                    a_new, b_new, c_new = coeffs
-                    new_ages = np.arange(0, laps_after)
-                    if laps_after > 0:
-                        fuel_new = fuel_after - cons_per_lap * new_ages
-                        if (fuel_new < 0).any():
-                            continue
-                        time_new = float(
-                            np.sum(a_new + b_new * new_ages + c_new * fuel_new)
-                        )
-                    else:
-                        time_new = 0.0
-                else:
-                    a_new, b_new = coeffs[0], coeffs[1]
-                    time_new = stint_time(a_new, b_new, laps_after)
-            except (ValueError, TypeError, RuntimeError, IndexError):
-                # Skip this compound if calculation fails
-                continue
-            if best_tail_time is None or time_new < best_tail_time:
-                best_tail_time = time_new
-                best_comp_alt = comp
-        if best_comp_alt is None or best_tail_time is None:
-            continue
-        total = time_current + pit_loss + best_tail_time
-        evaluations.append(
-            {
-                "pit_on_lap": current_lap + pit_in,
-                "continue_laps": pit_in,
-                "new_compound": best_comp_alt,
-                "projected_total_remaining": total,
-            }
+    # Best remaining-race tail per pit lap, computed once for every compound
+    # over the whole window instead of per (pit lap, compound) pair.
+    n_window = min(window, rem_laps)
+    # One lap-offset buffer shared by the vectors below (views, no new aranges)
+    offsets = np.arange(n_window + 1)
+    pit_ins = offsets[1:]
+    tail_comps: List[str] = []
+    tail_rows: List[np.ndarray] = []
+    for comp, coeffs in models.items():
+        row = _stint_times(
+            coeffs,
+            rem_laps - pit_ins,
+            current_fuel - cons_per_lap * pit_ins,
+            use_fuel,
+            cons_per_lap,
+            race_temp,
         )
-    if not evaluations:
+        if row is not None:
+            tail_comps.append(comp)
+            tail_rows.append(row)
+    tail_best_idx: Optional[np.ndarray] = None
+    tail_best = np.empty(0)
+    if tail_rows:
+        tail_matrix = np.vstack(tail_rows)
+        tail_best_idx = _argmin_first(tail_matrix)  # first compound wins ties
+        tail_best = tail_matrix[tail_best_idx, offsets[:-1]]
+
+    if tail_best_idx is None:
         return None
-    best = evaluations[0]
-    best_val = float(best["projected_total_remaining"])
-    for ev in evaluations[1:]:
-        try:
-            v = float(ev["projected_total_remaining"])
-        except (ValueError, TypeError):
-            continue
-        if v < best_val:
-            best_val = v
-            best = ev
-    return best
+    # Time on the current tires up to each pit lap as one cumulative sum
+    ages = current_tire_age + offsets[:-1]
+    per_lap = a_cur + b_cur * ages
+    feasible = np.ones(n_window, dtype=bool)
+    if use_fuel and c_cur is not None:
+        fuel_seg = current_fuel - cons_per_lap * offsets[:-1]
+        per_lap = per_lap + c_cur * fuel_seg
+        # A pit lap is only reachable if fuel never went negative before it
+        feasible = ~np.logical_or.accumulate(fuel_seg < 0)
+    totals = np.cumsum(per_lap) + pit_loss + tail_best
+    totals = np.where(feasible & np.isfinite(totals), totals, np.inf)
+    col = int(_argmin_first(totals))  # first pit lap wins ties
+    if not np.isfinite(totals[col]):
+        return None
+    pit_in = col + 1
+    return {
+        "pit_on_lap": current_lap + pit_in,
+        "continue_laps": pit_in,
+        "new_compound": tail_comps[int(tail_best_idx[col])],
+        "projected_total_remaining": float(totals[col]),
+    }
 
 
 def plan_aware_recommendation(
@@ -455,8 +798,34 @@ def plan_aware_recommendation(
     if current_compound not in models or next_compound not in models:
         return None
 
-    cur_coeffs = models[current_compound]
-    nxt_coeffs = models[next_compound]
+    def _effective(coeffs: Tuple[float, ...]) -> Tuple[float, float, float]:
+        """``(a, b_age, c_fuel)`` with the temperature term folded into ``a``."""
+        if len(coeffs) == 4:
+            a, b_age, c_fuel, d_temp = coeffs
+            return a + d_temp * race_temp, b_age, c_fuel
+        if len(coeffs) == 3:
+            a, b_age, c_fuel = coeffs
+            return a, b_age, c_fuel
+        return coeffs[0], coeffs[1], 0.0
+
+    a_c, b_c, cf_c = _effective(models[current_compound])
+    a_n, b_n, cf_n = _effective(models[next_compound])
+
+    def _stint_sum(
+        a: float, b_age: float, c_fuel: float, n: int, age0: float, fuel0: float
+    ) -> Optional[float]:
+        """Closed-form sum over ``n`` laps of ``a + b*age (+ c*fuel)``.
+
+        Ages run ``age0..age0+n-1`` and fuel ``fuel0 - cons*k``; ``None`` when
+        the fuel term is used and the tank would go negative within the stint.
+        """
+        tri = n * (n - 1) / 2.0
+        total = n * a + b_age * (n * age0 + tri)
+        if use_fuel and c_fuel != 0.0:
+            if min(fuel0, fuel0 - cons_per_lap * (n - 1)) < 0:
+                return None
+            total += c_fuel * (n * fuel0 - cons_per_lap * tri)
+        return total
 
     def _eval_pit_at(pit_lap: int) -> Optional[float]:
         laps_before = pit_lap - current_lap
@@ -464,48 +833,14 @@ def plan_aware_recommendation(
         if laps_before < 1 or laps_after < 1:
             return None
 
-        ages_b = np.arange(current_tire_age, current_tire_age + laps_before)
-        ages_a = np.arange(0, laps_after)
-
-        # Effective base for current compound
-        if len(cur_coeffs) == 4:
-            a_c, b_c, cf_c, dt_c = cur_coeffs
-            a_c = a_c + dt_c * race_temp
-        elif len(cur_coeffs) == 3:
-            a_c, b_c, cf_c = cur_coeffs
-        else:
-            a_c, b_c = cur_coeffs[0], cur_coeffs[1]
-            cf_c = 0.0
-
-        # Effective base for next compound
-        if len(nxt_coeffs) == 4:
-            a_n, b_n, cf_n, dt_n = nxt_coeffs
-            a_n = a_n + dt_n * race_temp
-        elif len(nxt_coeffs) == 3:
-            a_n, b_n, cf_n = nxt_coeffs
-        else:
-            a_n, b_n = nxt_coeffs[0], nxt_coeffs[1]
-            cf_n = 0.0
-
-        try:
-            if use_fuel and cf_c != 0.0:
-                fuel_seq_b = current_fuel - cons_per_lap * np.arange(0, laps_before)
-                if (fuel_seq_b < 0).any():
-                    return None
-                t_before = float(np.sum(a_c + b_c * ages_b + cf_c * fuel_seq_b))
-                fuel_at_pit = current_fuel - cons_per_lap * laps_before
-            else:
-                t_before = float(np.sum(a_c + b_c * ages_b))
-                fuel_at_pit = current_fuel - cons_per_lap * laps_before
-
-            if use_fuel and cf_n != 0.0:
-                fuel_seq_a = fuel_at_pit - cons_per_lap * np.arange(0, laps_after)
-                if (fuel_seq_a < 0).any():
-                    return None
-                t_after = float(np.sum(a_n + b_n * ages_a + cf_n * fuel_seq_a))
-            else:
-                t_after = float(np.sum(a_n + b_n * ages_a))
-        except Exception:
+        t_before = _stint_sum(
+            a_c, b_c, cf_c, laps_before, current_tire_age, current_fuel
+        )
+        if t_before is None:
+            return None
+        fuel_at_pit = current_fuel - cons_per_lap * laps_before
+        t_after = _stint_sum(a_n, b_n, cf_n, laps_after, 0.0, fuel_at_pit)
+        if t_after is None:
             return None
 
         return t_before + pit_loss + t_after
@@ -529,7 +864,12 @@ def plan_aware_recommendation(
         if candidate == planned_pit_lap:
             continue
         t = _eval_pit_at(candidate)
-        if t is not None and t < best_time:
+        # Near-equal times keep the planned (or earlier) lap
+        if (
+            t is not None
+            and t < best_time
+            and not np.isclose(t, best_time, rtol=_TIE_RTOL, atol=0.0)
+        ):
             best_time = t
             best_pit_lap = candidate
 
@@ -105,7 +105,7 @@ def save_tire_research(
     # Detectar columna de sesión
     session_col = "session" if "session" in laps.columns else None
 
-    for comp_raw, grp in laps.groupby("compound"):
+    for comp_raw, grp in laps.groupby("compound", observed=True):
         comp = str(comp_raw)
 
         # Determinar el paceMode dominante global del compuesto
@@ -124,8 +124,8 @@ def save_tire_research(
             wd = grp[["tire_age", wear_col]].dropna()
             wd = wd[wd[wear_col] > 0]
             if len(wd) >= 3 and wd["tire_age"].nunique() >= 2:
-                ages_w = np.array(wd["tire_age"].values, dtype=float)
-                wear_v = np.array(wd[wear_col].values, dtype=float)
+                ages_w = wd["tire_age"].to_numpy(dtype=np.float64)
+                wear_v = wd[wear_col].to_numpy(dtype=np.float64)
                 a_w, b_w, r2_w = _fit_wear_slope(ages_w, wear_v)
                 b_w_scaled = b_w * scale
                 # Estimar max_stint con b_w escalado
@@ -151,7 +151,7 @@ def save_tire_research(
         # Degradación de tiempo (por sesión y global)
         time_entries: dict = {}
         sessions_iter = (
-            grp.groupby(session_col).groups.items()
+            grp.groupby(session_col, observed=True).groups.items()
             if session_col
             else [("all", grp.index)]
         )
@@ -167,8 +167,8 @@ def save_tire_research(
             td = td[np.abs(z.values) < 3]
             if len(td) < 3:
                 continue
-            ages_t = np.array(td["tire_age"].values, dtype=float)
-            times_t = np.array(td["lap_time_s"].values, dtype=float)
+            ages_t = td["tire_age"].to_numpy(dtype=np.float64)
+            times_t = td["lap_time_s"].to_numpy(dtype=np.float64)
             a_t, b_age, r2_t = _fit_time_slope(ages_t, times_t)
             # Escalar b_age al equivalente de carrera
             b_age_race = (
@@ -6,20 +6,51 @@ All docstrings use plain ASCII to avoid parser issues on Windows.
 
 from __future__ import annotations
 
+import hashlib
 import re
+import threading
+import time
+from collections import OrderedDict
 from dataclasses import dataclass
-from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
 
-from .imports import Dict, List, Optional, Path, np, pd
+import numpy as np
+import pandas as pd
 
+try:
+    from numba import njit
 
-@dataclass
+    _NUMBA_AVAILABLE = True
+except ImportError:
+    njit = None
+    _NUMBA_AVAILABLE = False
+
+
+@dataclass(frozen=True)
 class Stint:
     """Structure describing a detected stint.
 
     Averages ignore NaN. ``total_laps`` counts unique laps in the stint.
+    Immutable and slotted (no per-instance ``__dict__``); ``__slots__`` is
+    declared by hand because ``dataclass(slots=True)`` needs Python 3.10.
     """
 
+    __slots__ = (
+        "stint_number",
+        "start_lap",
+        "end_lap",
+        "compound",
+        "total_laps",
+        "avg_lap_time",
+        "avg_track_temp",
+        "avg_air_temp",
+        "avg_fl_temp",
+        "avg_fr_temp",
+        "avg_rl_temp",
+        "avg_rr_temp",
+    )
+
     stint_number: int
     start_lap: int
     end_lap: int
@@ -33,6 +64,15 @@ class Stint:
     avg_rl_temp: Optional[float]
     avg_rr_temp: Optional[float]
 
+    # Frozen + slotted instances cannot be restored by pickle's default
+    # setattr path (st.cache_data pickles stints), so round-trip explicitly.
+    def __getstate__(self) -> tuple:
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __setstate__(self, state: tuple) -> None:
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
+
 
 SESSION_COL_MAP = {
     "lap": "currentLap",
@@ -53,6 +93,25 @@ SESSION_COL_MAP = {
     "rubber": "rubber",
 }
 
+# Columns that must be numeric for pit detection / aggregation. Coerced once at
+# load time so later passes can use them as-is. ``lastLapTime`` is excluded on
+# purpose: it may hold "m:ss.xxx" strings parsed by _lap_times_to_seconds.
+# Temperatures and fuel carry ~4 significant digits, so they are stored as
+# float32 (half the bytes through every groupby/mean) regardless of source dtype.
+FLOAT32_SESSION_COLS = (
+    SESSION_COL_MAP["air_temp"],
+    SESSION_COL_MAP["track_temp"],
+    SESSION_COL_MAP["fl_temp"],
+    SESSION_COL_MAP["fr_temp"],
+    SESSION_COL_MAP["rl_temp"],
+    SESSION_COL_MAP["rr_temp"],
+    "fuel",
+)
+NUMERIC_SESSION_COLS = (
+    SESSION_COL_MAP["lap"],
+    SESSION_COL_MAP["tire_age"],
+) + FLOAT32_SESSION_COLS
+
 # Common column names used throughout the application
 COL_LAP = "currentLap"
 COL_LAP_TIME = "lap_time_s"
@@ -73,6 +132,7 @@ DIR_CURATED = "curated"
 DIR_MODELS = "models"
 DIR_LOGS_IN = "logs_in"
 DIR_EXPORTED_DATA = "exported_data"
+DIR_CACHE = ".cache"
 
 # File extensions
 EXT_PARQUET = ".parquet"
@@ -80,54 +140,207 @@ EXT_JSON = ".json"
 EXT_CSV = ".csv"
 
 
-def optimize_dataframe_memory(df: pd.DataFrame) -> pd.DataFrame:
-    """Optimize DataFrame memory usage by downcasting numeric types.
-
-    - Convert int64 to int32/int16 where appropriate
-    - Convert float64 to float32 where appropriate
-    - Preserve object and bool columns as-is
+# Narrowest-first integer targets for optimize_dataframe_memory:
+# (lower bound, upper bound, dtype). Unsigned targets are opt-in.
+_INT_DOWNCAST = tuple(
+    (int(np.iinfo(t).min), int(np.iinfo(t).max), np.dtype(t))
+    for t in (np.int8, np.int16, np.int32)
+)
+_UINT_DOWNCAST = tuple(
+    (0, int(np.iinfo(t).max), np.dtype(t)) for t in (np.uint8, np.uint16, np.uint32)
+)
+# Object columns become categorical only below this distinct/rows ratio
+CATEGORY_MAX_UNIQUE_RATIO = 0.5
+
+
+def _minmax_kernel(values: np.ndarray) -> Tuple[int, int]:
+    """Return ``(min, max)`` of a non-empty integer array in one pass."""
+    lo = values[0]
+    hi = values[0]
+    for i in range(1, values.shape[0]):
+        v = values[i]
+        if v < lo:
+            lo = v
+        elif v > hi:
+            hi = v
+    return lo, hi
+
+
+if _NUMBA_AVAILABLE:
+    _minmax_kernel = njit(cache=True)(_minmax_kernel)
+
+
+def _int_bounds(values: np.ndarray) -> Tuple[int, int]:
+    """Min/max of ``values``: one jitted pass when Numba is installed."""
+    if _NUMBA_AVAILABLE:
+        lo, hi = _minmax_kernel(values)
+    else:
+        lo, hi = values.min(), values.max()
+    return int(lo), int(hi)
+
+
+def optimize_dataframe_memory(
+    df: pd.DataFrame,
+    skip: Optional[List[str]] = None,
+    obj2cat: bool = False,
+    int2uint: bool = False,
+) -> pd.DataFrame:
+    """Optimize DataFrame memory usage by downcasting column types.
+
+    - Convert int64 to the narrowest int32/int16/int8 that holds the range
+      (unsigned types instead when ``int2uint`` and the column is >= 0)
+    - Convert float64 to float32
+    - Convert object columns to ``category`` when ``obj2cat`` and fewer than
+      half of the values are distinct
+    - Preserve bool columns and any column listed in ``skip`` as-is
+
+    Target dtypes are collected first and applied with one ``astype``; columns
+    whose dtype would not change are left out of it, so an already compact
+    frame is returned untouched.
     """
     if df.empty:
         return df
 
-    # Create a copy to avoid modifying the original
-    df_opt = df.copy()
+    skipped = set(skip or ())
+    n_rows = len(df)
+    new_dtypes: dict = {}
+    for col, dtype in df.dtypes.items():
+        if col in skipped:
+            continue
+        if dtype == np.int64:
+            lo, hi = _int_bounds(df[col].to_numpy())
+            table = _UINT_DOWNCAST if int2uint and lo >= 0 else _INT_DOWNCAST
+            for t_min, t_max, target in table:
+                if lo >= t_min and hi <= t_max:
+                    new_dtypes[col] = target
+                    break
+            # Otherwise keep as int64
+        elif dtype == np.float64:
+            new_dtypes[col] = np.float32
+        elif obj2cat and pd.api.types.is_object_dtype(dtype):
+            if df[col].nunique() < CATEGORY_MAX_UNIQUE_RATIO * n_rows:
+                new_dtypes[col] = "category"
+
+    if not new_dtypes:
+        return df
+    return df.astype(new_dtypes)
 
-    # Downcast integer columns
-    int_cols = (
-        df.select_dtypes(include=[np.number]).select_dtypes(include=["int64"]).columns
-    )
-    for col in int_cols:
-        # Check if values fit in smaller integer types
-        col_min = df[col].min()
-        col_max = df[col].max()
-
-        if col_min >= np.iinfo(np.int8).min and col_max <= np.iinfo(np.int8).max:
-            df_opt[col] = df[col].astype(np.int8)
-        elif col_min >= np.iinfo(np.int16).min and col_max <= np.iinfo(np.int16).max:
-            df_opt[col] = df[col].astype(np.int16)
-        elif col_min >= np.iinfo(np.int32).min and col_max <= np.iinfo(np.int32).max:
-            df_opt[col] = df[col].astype(np.int32)
-        # Otherwise keep as int64
-
-    # Downcast float columns to float32
-    float_cols = (
-        df.select_dtypes(include=[np.number]).select_dtypes(include=["float64"]).columns
-    )
-    for col in float_cols:
-        df_opt[col] = df[col].astype(np.float32)
 
-    return df_opt
+def _to_numeric(s: pd.Series) -> pd.Series:
+    """Coerce ``s`` to a numeric dtype; no-op when it already is one."""
+    if pd.api.types.is_numeric_dtype(s):
+        return s
+    return pd.to_numeric(s, errors="coerce")
+
+
+# Parsed session frames by CSV path -> ((mtime_ns, size), frame), least
+# recently used first. Keyed on the path alone so a live log rewritten on
+# every refresh replaces its entry instead of piling up stale copies.
+# Guarded by a lock because practice loading reads CSVs on a thread pool.
+_SESSION_FRAMES_MAX = 32
+_SESSION_FRAMES: "OrderedDict[str, Tuple[Tuple[int, int], pd.DataFrame]]" = (
+    OrderedDict()
+)
+_SESSION_FRAMES_LOCK = threading.Lock()
 
 
 def load_session_csv(csv_path: Path) -> pd.DataFrame:
     """Load and lightly normalize a session CSV.
 
     - Convert ``timestamp`` to datetime if present.
+    - Coerce ``NUMERIC_SESSION_COLS`` to numeric dtypes
+      (``FLOAT32_SESSION_COLS`` always end up as float32).
     - Sort by ``timestamp`` when ``currentLap`` exists.
+
+    Parsed frames are cached per path for the lifetime of the process and
+    reused while the file's mtime and size are unchanged; a file rewritten by
+    the logger is re-read and replaces its previous frame, so each file holds
+    at most one cached copy. Callers get a shallow copy, so adding columns
+    does not touch the cache.
+    Across processes the normalized frame of a finished export under
+    ``logs_in/exported_data`` is also kept as Parquet in the project's
+    ``.cache/`` (best-effort, skipped without pyarrow). Files modified within
+    the last ``LIVE_FILE_SECONDS`` are still being written by the logger and
+    are never cached on disk.
+    """
+    path = str(csv_path)
+    stat = Path(csv_path).stat()
+    version = (stat.st_mtime_ns, stat.st_size)
+    with _SESSION_FRAMES_LOCK:
+        hit = _SESSION_FRAMES.get(path)
+        if hit is not None and hit[0] == version:
+            _SESSION_FRAMES.move_to_end(path)
+            return hit[1].copy(deep=False)
+    df = _load_session_frame(path, stat.st_mtime_ns, stat.st_size)
+    with _SESSION_FRAMES_LOCK:
+        _SESSION_FRAMES[path] = (version, df)
+        _SESSION_FRAMES.move_to_end(path)
+        while len(_SESSION_FRAMES) > _SESSION_FRAMES_MAX:
+            _SESSION_FRAMES.popitem(last=False)
+    return df.copy(deep=False)
+
+
+# Exports touched this recently are treated as live logs still being written
+LIVE_FILE_SECONDS = 300
+# Bump when the parsed-session layout changes so older Parquet copies are ignored
+_SESSION_CACHE_VERSION = 1
+
+
+def _session_parquet_path(csv_path: Path, mtime_ns: int, size: int) -> Optional[Path]:
+    """Parquet copy of a parsed session CSV under the project ``.cache/``.
+
+    Only exports inside ``<project>/logs_in/exported_data`` get one, so the
+    copy never lands in the export tree that practice discovery walks.
+    Returns None for files elsewhere.
     """
+    parts = csv_path.resolve().parts
+    for i in range(len(parts) - 2, 0, -1):
+        if parts[i] == DIR_LOGS_IN and parts[i + 1] == DIR_EXPORTED_DATA:
+            project_root = Path(*parts[:i])
+            break
+    else:
+        return None
+    owner = hashlib.blake2b(str(csv_path.resolve()).encode(), digest_size=6).hexdigest()
+    key = hashlib.blake2b(
+        f"{_SESSION_CACHE_VERSION}|{mtime_ns}|{size}".encode(), digest_size=8
+    ).hexdigest()
+    return project_root / DIR_CACHE / f"session_{owner}_{key}{EXT_PARQUET}"
+
+
+def _load_session_frame(csv_path: str, mtime_ns: int, size: int) -> pd.DataFrame:
+    cache_path: Optional[Path] = None
+    if time.time() - mtime_ns / 1e9 >= LIVE_FILE_SECONDS:
+        cache_path = _session_parquet_path(Path(csv_path), mtime_ns, size)
+    if cache_path is None:
+        return _parse_session_csv(csv_path)
+    if cache_path.exists():
+        try:
+            return pd.read_parquet(cache_path)
+        except (ImportError, OSError, TypeError, ValueError):
+            pass
+    df = _parse_session_csv(csv_path)
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(".tmp")
+        df.to_parquet(tmp_path, compression="zstd")
+        tmp_path.replace(cache_path)
+        # Drop copies of earlier versions of this file
+        owner_prefix = cache_path.stem.rsplit("_", 1)[0] + "_"
+        for stale in cache_path.parent.glob(f"{owner_prefix}*{EXT_PARQUET}"):
+            if stale != cache_path:
+                stale.unlink()
+    except (ImportError, OSError, TypeError, ValueError):
+        pass
+    return df
 
+
+def _parse_session_csv(csv_path: str) -> pd.DataFrame:
     df = pd.read_csv(csv_path, low_memory=False)
+    for col in NUMERIC_SESSION_COLS:
+        if col in df.columns:
+            df[col] = _to_numeric(df[col])
+            if col in FLOAT32_SESSION_COLS:
+                df[col] = df[col].astype(np.float32)
     if "timestamp" in df.columns:
         df["timestamp"] = pd.to_datetime(df["timestamp"])
     if SESSION_COL_MAP["lap"] in df.columns and "timestamp" in df.columns:
@@ -176,6 +389,95 @@ def load_multi_session_csvs(driver_dir: Path) -> pd.DataFrame:
     return optimize_dataframe_memory(merged)
 
 
+# Statuses that indicate the car is somewhere in the pit lane
+_PIT_LANE_STATUSES = frozenset(
+    {
+        "requested",
+        "entering",
+        "queuing",
+        "stopped",
+        "exiting",
+        "in garage",
+        "jack up",
+        "releasing",
+        "car setup",
+        "approach",
+        "penalty",
+    }
+)
+
+
+def _pit_lane_mask(status: pd.Series) -> np.ndarray:
+    """Flag rows whose pit status is one of ``_PIT_LANE_STATUSES``.
+
+    The status column has a handful of distinct values, so the strip/lower
+    normalisation runs on the factorized uniques instead of every row.
+    """
+    codes, uniques = pd.factorize(status)
+    uniq_flags = (
+        pd.Index(uniques).astype(str).str.strip().str.lower().isin(_PIT_LANE_STATUSES)
+    )
+    flags = np.append(uniq_flags, False)  # code -1 (NaN) -> False
+    return flags[codes]
+
+
+def _tire_change_kernel(
+    tire_age: np.ndarray, lap: np.ndarray, comp_codes: np.ndarray, has_comp: bool
+) -> np.ndarray:
+    """Row-wise tyre-change rules of ``detect_pit_events`` in a single loop.
+
+    ``tire_age`` and ``lap`` are float64 (NaN for missing, which never
+    matches a rule); ``comp_codes`` are factorized compounds.
+    """
+    n = tire_age.shape[0]
+    out = np.zeros(n, dtype=np.bool_)
+    if n == 0:
+        return out
+    # The first row has no previous compound, which always counts as a change
+    out[0] = has_comp and tire_age[0] <= 1
+    for i in range(1, n):
+        ta = tire_age[i]
+        prev = tire_age[i - 1]
+        in_lap = lap[i] > 0
+        if in_lap and ta == 0 and prev > 0:
+            out[i] = True
+        elif in_lap and ta < prev and prev >= 2:
+            out[i] = True
+        elif has_comp and ta <= 1 and comp_codes[i] != comp_codes[i - 1]:
+            out[i] = True
+    return out
+
+
+if _NUMBA_AVAILABLE:
+    _tire_change_kernel = njit(cache=True)(_tire_change_kernel)
+
+
+def _tire_change_flags(
+    tire_age: np.ndarray, lap: np.ndarray, comp_codes: Optional[np.ndarray]
+) -> np.ndarray:
+    """Tyre-change flags: one jitted pass with Numba, NumPy masks otherwise.
+
+    A change is a tyre-age reset to 0, a drop from an age of 2+ (both only
+    on laps > 0) or a compound change while ``tire_age <= 1``.
+    """
+    has_comp = comp_codes is not None
+    codes = comp_codes if comp_codes is not None else np.zeros(len(tire_age), np.int64)
+    if _NUMBA_AVAILABLE:
+        return _tire_change_kernel(tire_age, lap, codes, has_comp)
+
+    prev = np.empty_like(tire_age)
+    prev[:1] = np.nan
+    prev[1:] = tire_age[:-1]
+    in_lap = lap > 0
+    flags = ((tire_age == 0) & (prev > 0) | (tire_age < prev) & (prev >= 2)) & in_lap
+    if has_comp and len(codes):
+        comp_change = np.empty(len(codes), dtype=bool)
+        comp_change[0] = True
+        comp_change[1:] = codes[1:] != codes[:-1]
+        flags |= comp_change & (tire_age <= 1)
+    return flags
+
+
 def detect_pit_events(df: pd.DataFrame) -> pd.DataFrame:
     """Add boolean columns 'pit_stop' and 'tire_change_pit' using heuristics.
 
@@ -185,13 +487,6 @@ def detect_pit_events(df: pd.DataFrame) -> pd.DataFrame:
                          (reset de tire_age o cambio de compuesto). Usado para
                          cortar stints en build_stints.
     """
-    # Statuses that indicate the car is somewhere in the pit lane
-    _PIT_LANE_STATUSES = {
-        "requested", "entering", "queuing", "stopped",
-        "exiting", "in garage", "jack up", "releasing",
-        "car setup", "approach", "penalty",
-    }
-
     if SESSION_COL_MAP["lap"] not in df.columns:
         df["pit_stop"] = False
         df["tire_change_pit"] = False
@@ -205,72 +500,63 @@ def detect_pit_events(df: pd.DataFrame) -> pd.DataFrame:
 
     if SESSION_COL_MAP["tire_age"] not in df.columns:
         comp = df.get(SESSION_COL_MAP["compound"])
-        if isinstance(comp, pd.Series):
-            base_flags: pd.Series = comp.ne(comp.shift(1)).fillna(False).astype(bool)
-        else:
-            base_flags = pd.Series(False, index=df.index, dtype=bool)
+        base_flags = np.zeros(len(df.index), dtype=bool)
+        if isinstance(comp, pd.Series) and len(comp):
+            # ne(shift(1)) on integer codes; a missing compound (code -1)
+            # never equals its neighbour, as NaN did in the Series compare
+            codes = pd.factorize(comp)[0]
+            base_flags[0] = True
+            base_flags[1:] = (
+                (codes[1:] != codes[:-1]) | (codes[1:] < 0) | (codes[:-1] < 0)
+            )
 
         if pit_status_col:
-            ps = df[pit_status_col].astype(str).str.strip().str.lower()
-            status_flags = ps.isin(_PIT_LANE_STATUSES)
-            df["pit_stop"] = (base_flags | status_flags).fillna(False)
-        else:
-            df["pit_stop"] = base_flags
-        df["tire_change_pit"] = df["pit_stop"]
+            base_flags |= _pit_lane_mask(df[pit_status_col])
+        df["pit_stop"] = base_flags
+        df["tire_change_pit"] = base_flags.copy()
         return df
 
-    tire_age = pd.to_numeric(df[SESSION_COL_MAP["tire_age"]], errors="coerce")
-    lap = pd.to_numeric(df[SESSION_COL_MAP["lap"]], errors="coerce")
+    # Already numeric when loaded via load_session_csv; coerced here otherwise
+    tire_age = _to_numeric(df[SESSION_COL_MAP["tire_age"]]).to_numpy(
+        dtype=np.float64, na_value=np.nan
+    )
+    lap = _to_numeric(df[SESSION_COL_MAP["lap"]]).to_numpy(
+        dtype=np.float64, na_value=np.nan
+    )
     comp = df.get(SESSION_COL_MAP["compound"])
-    comp_prev = comp.shift(1) if isinstance(comp, pd.Series) else None
-    age_prev = tire_age.shift(1)
-
-    reset_zero = (tire_age == 0) & (age_prev > 0) & (lap > 0)
-    age_drop = (tire_age < age_prev) & (age_prev >= 2) & (lap > 0)
-
-    comp_change: pd.Series
-    if isinstance(comp, pd.Series) and isinstance(comp_prev, pd.Series):
-        comp_change = (
-            (comp.astype(str).ne(comp_prev.astype(str)) & (tire_age <= 1))
-            .fillna(False)
-            .astype(bool)
-        )
-    else:
-        comp_change = pd.Series([False] * len(df.index), index=df.index, dtype=bool)
+    comp_codes = (
+        pd.factorize(comp)[0].astype(np.int64) if isinstance(comp, pd.Series) else None
+    )
 
     # tire_change_pit: solo cuando realmente se cambiaron los neumáticos
-    tire_change_flags = (reset_zero | age_drop | comp_change).fillna(False)
+    tire_change_flags = _tire_change_flags(tire_age, lap, comp_codes)
 
     # pit_stop: cualquier vuelta en boxes (incluye paradas sin cambio de rueda)
     pit_flags = tire_change_flags.copy()
     if pit_status_col:
-        ps = df[pit_status_col].astype(str).str.strip().str.lower()
-        status_flags = ps.isin(_PIT_LANE_STATUSES)
-        pit_flags = (pit_flags | status_flags).fillna(False)
+        pit_flags |= _pit_lane_mask(df[pit_status_col])
 
     df["pit_stop"] = pit_flags
-    df["tire_change_pit"] = tire_change_flags.astype(bool)
+    df["tire_change_pit"] = tire_change_flags
     return df
 
 
-@lru_cache(maxsize=512)
-def _parse_lap_time_to_seconds(v) -> Optional[float]:
-    """Accept floats (seconds) or strings like 'm:ss.xxx' and return seconds.
+# "ss.xxx" or "m:ss.xxx"
+_LAP_TIME_RE = re.compile(r"^(?:(\d+):)?(\d+(?:\.\d+)?)$")
 
-    Returns None when unparsable.
-    """
 
-    if v is None or (isinstance(v, float) and pd.isna(v)):
-        return None
-    if isinstance(v, (int, float)):
-        return float(v)
-    s = str(v).strip()
-    m = re.match(r"^(?:(\d+):)?(\d+(?:\.\d+)?)$", s)
-    if not m:
-        return None
-    mins = int(m.group(1) or 0)
-    secs = float(m.group(2))
-    return mins * 60 + secs
+def _lap_times_to_seconds(raw: pd.Series) -> pd.Series:
+    """Lap times in seconds (float64) from seconds or ``m:ss.xxx`` strings.
+
+    Numeric columns already hold seconds; text columns go through a single
+    ``str.extract`` scan instead of one Python call per lap. Unparsable
+    values become NaN.
+    """
+    if pd.api.types.is_numeric_dtype(raw) and not pd.api.types.is_bool_dtype(raw):
+        return raw.astype(np.float64)
+    parts = raw.astype("string").str.strip().str.extract(_LAP_TIME_RE)
+    mins = parts[0].astype(np.float64).fillna(0.0)
+    return mins * 60.0 + parts[1].astype(np.float64)
 
 
 def build_lap_summary(df: pd.DataFrame) -> pd.DataFrame:
@@ -280,36 +566,47 @@ def build_lap_summary(df: pd.DataFrame) -> pd.DataFrame:
     if lap_col not in df.columns:
         return pd.DataFrame()
 
-    ordered = df.sort_values("timestamp") if "timestamp" in df.columns else df
+    # load_session_csv already returns timestamp order; only sort when needed
+    ordered = df
+    if "timestamp" in df.columns and not df["timestamp"].is_monotonic_increasing:
+        ordered = df.sort_values("timestamp", kind="stable")
 
-    # annotate once
-    pit_by_lap: pd.Series
-    tire_change_by_lap: pd.Series
-    if "pit_stop" in ordered.columns:
-        pit_by_lap = ordered.groupby(lap_col)["pit_stop"].any()
-    else:
-        uniq = list(ordered[lap_col].unique())
-        pit_by_lap = pd.Series([False] * len(uniq), index=uniq, dtype=bool)
+    # Lap of every sample as dense codes; the last sample of each lap is the
+    # end-of-lap snapshot. Per-lap pit flags are OR-reduced with one bincount
+    # over those codes instead of a groupby per flag column.
+    laps = ordered[lap_col]
+    codes, uniques = pd.factorize(laps)
+    valid = codes >= 0  # rows without a lap are dropped, as groupby did
+    last_mask = ~laps.duplicated(keep="last").to_numpy() & valid
+    last_codes = codes[last_mask]
 
-    if "tire_change_pit" in ordered.columns:
-        tire_change_by_lap = ordered.groupby(lap_col)["tire_change_pit"].any()
-    else:
-        tire_change_by_lap = pit_by_lap
+    def _any_per_lap(flag_col: str) -> np.ndarray:
+        flags = ordered[flag_col].to_numpy(dtype=bool, na_value=False)
+        hits = np.bincount(codes[valid], weights=flags[valid], minlength=len(uniques))
+        return hits[last_codes] > 0
 
-    lap_last = ordered.groupby(lap_col).tail(1).copy()
+    lap_last = ordered.loc[last_mask]
 
-    # Compute avg_wear from per-tire wear columns (end-of-lap snapshot via tail(1))
+    # avg_wear from per-tire wear columns (end-of-lap snapshot)
     _wear_raw = [c for c in ["flDeg", "frDeg", "rlDeg", "rrDeg"] if c in lap_last.columns]
+    new_cols: Dict[str, object] = {}
     if _wear_raw:
-        lap_last[COL_AVG_WEAR] = lap_last[_wear_raw].mean(axis=1)
+        new_cols[COL_AVG_WEAR] = lap_last[_wear_raw].mean(axis=1)
 
-    lap_last["pit_stop"] = lap_last[lap_col].map(pit_by_lap).fillna(False)
-    lap_last["tire_change_pit"] = lap_last[lap_col].map(tire_change_by_lap).fillna(False)
+    if "pit_stop" in ordered.columns:
+        new_cols["pit_stop"] = _any_per_lap("pit_stop")
+    else:
+        new_cols["pit_stop"] = np.zeros(len(lap_last), dtype=bool)
+    if "tire_change_pit" in ordered.columns:
+        new_cols["tire_change_pit"] = _any_per_lap("tire_change_pit")
+    else:
+        new_cols["tire_change_pit"] = new_cols["pit_stop"]
 
     if SESSION_COL_MAP["lap_time_col"] in lap_last.columns:
-        lap_last["lap_time_s"] = lap_last[SESSION_COL_MAP["lap_time_col"]].apply(
-            _parse_lap_time_to_seconds
+        new_cols["lap_time_s"] = _lap_times_to_seconds(
+            lap_last[SESSION_COL_MAP["lap_time_col"]]
         )
+    lap_last = lap_last.assign(**new_cols)
 
     cols = [
         lap_col,
@@ -340,41 +637,20 @@ def build_lap_summary(df: pd.DataFrame) -> pd.DataFrame:
     return result
 
 
-def _aggregate_stint(
-    stint_rows: pd.DataFrame, stint_number: int, compound: str
-) -> Stint:
-    """Aggregate metrics for a contiguous block of laps belonging to a single stint."""
-
-    metrics = {
-        "avg_lap_time": stint_rows["lap_time_s"].mean(skipna=True),
-        "avg_track_temp": stint_rows.get(
-            SESSION_COL_MAP["track_temp"], pd.Series(dtype=float)
-        ).mean(skipna=True),
-        "avg_air_temp": stint_rows.get(
-            SESSION_COL_MAP["air_temp"], pd.Series(dtype=float)
-        ).mean(skipna=True),
-        "avg_fl_temp": stint_rows.get(
-            SESSION_COL_MAP["fl_temp"], pd.Series(dtype=float)
-        ).mean(skipna=True),
-        "avg_fr_temp": stint_rows.get(
-            SESSION_COL_MAP["fr_temp"], pd.Series(dtype=float)
-        ).mean(skipna=True),
-        "avg_rl_temp": stint_rows.get(
-            SESSION_COL_MAP["rl_temp"], pd.Series(dtype=float)
-        ).mean(skipna=True),
-        "avg_rr_temp": stint_rows.get(
-            SESSION_COL_MAP["rr_temp"], pd.Series(dtype=float)
-        ).mean(skipna=True),
-    }
-
-    return Stint(
-        stint_number=stint_number,
-        start_lap=int(stint_rows[SESSION_COL_MAP["lap"]].min()),
-        end_lap=int(stint_rows[SESSION_COL_MAP["lap"]].max()),
-        compound=compound,
-        total_laps=int(stint_rows[SESSION_COL_MAP["lap"]].nunique()),
-        **metrics,
-    )
+# Stint field -> (lap-summary column, aggregation). Columns absent from the
+# lap summary are skipped and the field is left as NaN.
+_STINT_AGGREGATIONS = {
+    "start_lap": (SESSION_COL_MAP["lap"], "min"),
+    "end_lap": (SESSION_COL_MAP["lap"], "max"),
+    "total_laps": (SESSION_COL_MAP["lap"], "nunique"),
+    "avg_lap_time": ("lap_time_s", "mean"),
+    "avg_track_temp": (SESSION_COL_MAP["track_temp"], "mean"),
+    "avg_air_temp": (SESSION_COL_MAP["air_temp"], "mean"),
+    "avg_fl_temp": (SESSION_COL_MAP["fl_temp"], "mean"),
+    "avg_fr_temp": (SESSION_COL_MAP["fr_temp"], "mean"),
+    "avg_rl_temp": (SESSION_COL_MAP["rl_temp"], "mean"),
+    "avg_rr_temp": (SESSION_COL_MAP["rr_temp"], "mean"),
+}
 
 
 def build_stints(lap_summary: pd.DataFrame) -> List[Stint]:
@@ -393,40 +669,67 @@ def build_stints(lap_summary: pd.DataFrame) -> List[Stint]:
 
     ordered = lap_summary.sort_values(lap_col)
 
-    change_mask = (
-        ordered.get(SESSION_COL_MAP["compound"], pd.Series(dtype=str))
-        .astype(str)
-        .ne(
-            ordered.get(SESSION_COL_MAP["compound"], pd.Series(dtype=str))
-            .shift(1)
-            .astype(str)
+    # Stint boundaries as one boolean array: compound change, tyre-age reset
+    # or a tyre-change pit, compared on NumPy arrays instead of shifted Series.
+    n_laps = len(ordered)
+    change_mask = np.zeros(n_laps, dtype=bool)
+    if SESSION_COL_MAP["compound"] in ordered.columns:
+        # Factorized codes: consecutive missing compounds share code -1 and
+        # do not split a stint
+        comp = pd.factorize(ordered[SESSION_COL_MAP["compound"]])[0]
+        change_mask[0] = True
+        change_mask[1:] = comp[1:] != comp[:-1]
+    if SESSION_COL_MAP["tire_age"] in ordered.columns:
+        age = ordered[SESSION_COL_MAP["tire_age"]].to_numpy(
+            dtype=np.float64, na_value=np.nan
         )
-    )
-    tire_age = ordered.get(SESSION_COL_MAP["tire_age"])
-    if tire_age is not None:
-        reset_age = (tire_age == 0) & (tire_age.shift(1) > 0)
-        change_mask = change_mask | reset_age.fillna(False)
+        change_mask[1:] |= (age[1:] == 0) & (age[:-1] > 0)
 
     if "tire_change_pit" in ordered.columns:
-        change_mask = change_mask | ordered["tire_change_pit"].fillna(False)
+        change_mask |= ordered["tire_change_pit"].to_numpy(dtype=bool, na_value=False)
     elif "pit_stop" in ordered.columns:
-        change_mask = change_mask | ordered["pit_stop"].fillna(False)
-
-    stint_ids = change_mask.cumsum().fillna(0).astype(int)
-
-    for stint_number, (_, rows) in enumerate(ordered.groupby(stint_ids), start=1):
-        if rows.empty:
-            continue
-        compound = (
-            str(
-                rows.get(SESSION_COL_MAP["compound"], pd.Series(dtype=str))
-                .dropna()
-                .iloc[0]
+        change_mask |= ordered["pit_stop"].to_numpy(dtype=bool, na_value=False)
+
+    stint_ids = np.cumsum(change_mask)
+
+    # All stints aggregated in one groupby pass instead of ~10 scans per stint
+    grouped = ordered.groupby(stint_ids, sort=False)
+    agg = grouped.agg(
+        **{
+            field: spec
+            for field, spec in _STINT_AGGREGATIONS.items()
+            if spec[0] in ordered.columns
+        }
+    )
+    compound_col = SESSION_COL_MAP["compound"]
+    if compound_col in ordered.columns:
+        compounds = grouped[compound_col].first().tolist()
+    else:
+        compounds = [None] * len(agg)
+
+    def _field(name: str) -> List[float]:
+        if name in agg.columns:
+            return agg[name].astype(float).tolist()
+        return [float("nan")] * len(agg)
+
+    columns = {name: _field(name) for name in _STINT_AGGREGATIONS}
+    for i, compound in enumerate(compounds):
+        stints.append(
+            Stint(
+                stint_number=i + 1,
+                start_lap=int(columns["start_lap"][i]),
+                end_lap=int(columns["end_lap"][i]),
+                compound="unknown" if pd.isna(compound) else str(compound),
+                total_laps=int(columns["total_laps"][i]),
+                avg_lap_time=columns["avg_lap_time"][i],
+                avg_track_temp=columns["avg_track_temp"][i],
+                avg_air_temp=columns["avg_air_temp"][i],
+                avg_fl_temp=columns["avg_fl_temp"][i],
+                avg_fr_temp=columns["avg_fr_temp"][i],
+                avg_rl_temp=columns["avg_rl_temp"][i],
+                avg_rr_temp=columns["avg_rr_temp"][i],
             )
-            if SESSION_COL_MAP["compound"] in rows.columns
-            else "unknown"
         )
-        stints.append(_aggregate_stint(rows, stint_number, compound))
 
     return stints
 
@@ -453,10 +756,19 @@ def fia_compliance_check(
         notes.append("No stints detected.")
         return result
 
-    compounds = {s.compound for s in stints}
-    total_laps = sum(s.total_laps for s in stints)
+    # One pass over the stints for every aggregate the rules below need
+    compounds = set()
+    total_laps = 0
+    longest_stint = 0
+    for s in stints:
+        compounds.add(s.compound)
+        total_laps += s.total_laps
+        if s.total_laps > longest_stint:
+            longest_stint = s.total_laps
     weather_text = (
-        " ".join(weather_series.dropna().unique()) if weather_series is not None else ""
+        " ".join(set(weather_series.dropna().tolist()))
+        if weather_series is not None
+        else ""
     )
     is_dry = "Rain" not in weather_text and "Wet" not in weather_text
 
@@ -465,7 +777,7 @@ def fia_compliance_check(
         notes.append("Menos de dos compuestos usados en condiciones de seco.")
 
     max_allowed = int(total_laps * 0.7)
-    if any(s.total_laps > max_allowed for s in stints) and total_laps >= 15:
+    if longest_stint > max_allowed and total_laps >= 15:
         result["max_stint_ok"] = False
         notes.append("Un stint supera el 70% de la distancia (heurístico).")
 
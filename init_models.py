@@ -6,26 +6,24 @@ Este archivo mantiene compatibilidad con llamadas desde la raíz.
 
 from __future__ import annotations
 
-import importlib
 import sys
 from typing import Any
 
 
 def main(argv: list[str] | None = None) -> Any:
-    # Importar el módulo canónico y delegar al entrypoint `main`
-    mod = importlib.import_module("app.init_models")
-    if hasattr(mod, "main"):
-        # Si el módulo espera parsear sys.argv internamente, dejamos que lo haga.
-        if argv is None:
-            return mod.main()
-        # Inyectar temporalmente argv si se pasa
-        old_argv = sys.argv
-        try:
-            sys.argv = [old_argv[0]] + list(argv)
-            return mod.main()
-        finally:
-            sys.argv = old_argv
-    raise RuntimeError("Modulo 'app.init_models' no tiene entrypoint 'main'")
+    # Import directo del entrypoint canónico (cacheado en sys.modules)
+    from app.init_models import main as _main
+
+    # Si el módulo espera parsear sys.argv internamente, dejamos que lo haga.
+    if argv is None:
+        return _main()
+    # Inyectar temporalmente argv si se pasa
+    old_argv = sys.argv
+    try:
+        sys.argv = [old_argv[0]] + list(argv)
+        return _main()
+    finally:
+        sys.argv = old_argv
 
 
 if __name__ == "__main__":
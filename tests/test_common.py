@@ -0,0 +1,31 @@
+import os
+
+from f1m.common import _practice_cache_path, practice_sources_key
+
+
+def _touch(path, mtime):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text("timestamp,currentLap\n")
+    os.utime(path, ns=(mtime, mtime))
+
+
+def test_practice_cache_key_ignores_race_and_other_drivers(tmp_path):
+    data_root = tmp_path / "logs_in" / "exported_data"
+    track_dir = data_root / "Bahrain"
+    practice_csv = track_dir / "FP1" / "Fernando Alonso" / "fp1.csv"
+    race_csv = track_dir / "Race" / "Fernando Alonso" / "race.csv"
+    other_csv = track_dir / "FP1" / "Other Guy" / "fp1.csv"
+    for path in (practice_csv, race_csv, other_csv):
+        _touch(path, 1_000_000_000_000_000_000)
+
+    def cache_path():
+        sources = practice_sources_key(data_root, "Bahrain", "Fernando Alonso")
+        return _practice_cache_path(data_root, "Bahrain", "Fernando Alonso", sources)
+
+    before = cache_path()
+    _touch(race_csv, 1_000_000_001_000_000_000)
+    _touch(other_csv, 1_000_000_001_000_000_000)
+    assert cache_path() == before
+
+    _touch(practice_csv, 1_000_000_001_000_000_000)
+    assert cache_path() != before
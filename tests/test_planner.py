@@ -0,0 +1,69 @@
+import random
+
+import pandas as pd
+import pytest
+
+from f1m import planner
+
+
+def _plan_summary(plans):
+    return [
+        (p["total_time"], p["stops"], [(s["compound"], s["laps"]) for s in p["stints"]])
+        for p in plans
+    ]
+
+
+def _case(seed):
+    rnd = random.Random(seed)
+    compounds = rnd.sample(["Soft", "Medium", "Hard", "Inter"], rnd.randint(2, 3))
+    # Few distinct coefficients so many plans tie on total time
+    models = {
+        comp: (rnd.choice([90.0, 91.0]), rnd.choice([0.0, 0.05, 0.1]))
+        for comp in compounds
+    }
+    practice = pd.DataFrame(
+        {
+            "compound": [comp for comp in compounds for _ in range(5)],
+            "tire_age": [age for _ in compounds for age in range(5)],
+            "lap_time_s": 90.0,
+        }
+    )
+    return dict(
+        race_laps=rnd.randint(10, 40),
+        compounds=compounds,
+        models=models,
+        practice_laps=practice,
+        pit_loss=rnd.choice([0.0, 20.0]),
+        max_stops=rnd.randint(1, 3),
+        exact_stops=rnd.random() < 0.5,
+        min_stint=rnd.randint(1, 6),
+        top_k=rnd.randint(1, 8),
+    )
+
+
+@pytest.mark.parametrize("seed", range(60))
+def test_kernel_matches_python_dp(monkeypatch, seed):
+    kwargs = _case(seed)
+    # Run the array kernel uncompiled so the test does not depend on Numba
+    kernel = getattr(planner._plan_dp_kernel, "py_func", planner._plan_dp_kernel)
+    monkeypatch.setattr(planner, "_plan_dp_kernel", kernel)
+    for name in ("_fill_stints", "_stints_before"):
+        func = getattr(planner, name)
+        monkeypatch.setattr(planner, name, getattr(func, "py_func", func))
+
+    monkeypatch.setattr(planner, "_NUMBA_AVAILABLE", True)
+    from_kernel = _plan_summary(planner.enumerate_plans(**kwargs))
+    monkeypatch.setattr(planner, "_NUMBA_AVAILABLE", False)
+    from_python = _plan_summary(planner.enumerate_plans(**kwargs))
+
+    assert from_kernel == from_python
+    totals = [total for total, _stops, _stints in from_python]
+    assert totals == sorted(totals)
+
+
+@pytest.mark.parametrize("numba", [True, False])
+def test_zero_top_k_returns_no_plans(monkeypatch, numba):
+    kwargs = _case(0)
+    kwargs["top_k"] = 0
+    monkeypatch.setattr(planner, "_NUMBA_AVAILABLE", numba)
+    assert planner.enumerate_plans(**kwargs) == []